@@ -6,6 +6,8 @@ from typing import Iterable, Iterator, List, Optional, Tuple
 class DataStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
+        # Bumped on every OHLCV/history-limit write so readers can tell when cached query results are stale.
+        self.ohlcv_version = 0
         self._ensure_schema()
 
     @contextmanager
@@ -141,6 +143,37 @@ class DataStore:
                 ''',
                 rows,
             )
+        self.ohlcv_version += 1
+
+    def get_cache_state(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[int], bool]:
+        # get_cached_range + get_history_limit on one connection.
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT MIN(ts_ms), MAX(ts_ms) FROM ohlcv WHERE exchange=? AND symbol=? AND timeframe=?',
+                (exchange, symbol, timeframe),
+            ).fetchone()
+            limit = conn.execute(
+                '''
+                SELECT oldest_ts, oldest_reached
+                FROM ohlcv_limits
+                WHERE exchange=? AND symbol=? AND timeframe=?
+                ''',
+                (exchange, symbol, timeframe),
+            ).fetchone()
+        cached_range = None
+        if row and row[0] is not None and row[1] is not None:
+            cached_range = (int(row[0]), int(row[1]))
+        oldest_ts = None
+        oldest_reached = False
+        if limit:
+            oldest_ts = int(limit[0]) if limit[0] is not None else None
+            oldest_reached = bool(limit[1])
+        return cached_range, oldest_ts, oldest_reached
 
     def get_symbols(self, exchange: str) -> List[str]:
         with self._connect() as conn:
@@ -208,6 +241,7 @@ class DataStore:
                 ''',
                 (exchange, symbol, timeframe, oldest_ts, int(oldest_reached)),
             )
+        self.ohlcv_version += 1
 
     def clear_history_limit(self, exchange: str, symbol: str, timeframe: str) -> None:
         with self._connect() as conn:
@@ -218,6 +252,7 @@ class DataStore:
                 ''',
                 (exchange, symbol, timeframe),
             )
+        self.ohlcv_version += 1
 
     def get_indicator_instances(self) -> List[Tuple[str, str, str, str, bool, int]]:
         with self._connect() as conn:
@@ -250,6 +285,23 @@ class DataStore:
                 (instance_id, indicator_id, pane_id, params_json, int(visible), sort_index),
             )
 
+    def upsert_indicator_instances(self, rows: List[Tuple[str, str, str, str, bool, int]]) -> None:
+        if not rows:
+            return
+        params = [
+            (instance_id, indicator_id, pane_id, params_json, int(visible), sort_index)
+            for instance_id, indicator_id, pane_id, params_json, visible, sort_index in rows
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                '''
+                INSERT OR REPLACE INTO indicator_instances
+                (instance_id, indicator_id, pane_id, params_json, visible, sort_index)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ''',
+                params,
+            )
+
     def delete_indicator_instance(self, instance_id: str) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -6,6 +6,240 @@ from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the same loops run as plain Python without it.
+    njit = None
+
+
+# Scalar loop kernels behind the helpers below. They are written once in the
+# subset of Python numba compiles, and jitted at import when numba is present.
+# fastmath is left off: the kernels rely on NaN checks for warm-up gaps.
+
+def _smooth_loop(arr, alpha):
+    n = arr.size
+    out = np.empty(n, dtype=np.float64)
+    val = np.nan
+    for i in range(n):
+        v = arr[i]
+        if math.isnan(v):
+            out[i] = val
+            continue
+        if math.isnan(val):
+            val = v
+        else:
+            val = alpha * v + (1 - alpha) * val
+        out[i] = val
+    return out
+
+
+def _wma_loop(arr, weights, wsum, length):
+    n = arr.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    for i in range(length - 1, n):
+        acc = 0.0
+        for j in range(length):
+            v = arr[i + 1 - length + j]
+            if math.isnan(v):
+                acc = np.nan
+                break
+            acc += v * weights[j]
+        if not math.isnan(acc):
+            out[i] = acc / wsum
+    return out
+
+
+def _stdev_loop(arr, length):
+    n = arr.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    for i in range(length - 1, n):
+        window = arr[i + 1 - length: i + 1]
+        if np.any(np.isnan(window)):
+            continue
+        out[i] = np.std(window)
+    return out
+
+
+def _stoch_k_loop(h, l, c, k_len):
+    n = c.size
+    k = np.full(n, np.nan, dtype=np.float64)
+    for i in range(k_len - 1, n):
+        hh = np.nanmax(h[i + 1 - k_len: i + 1])
+        ll = np.nanmin(l[i + 1 - k_len: i + 1])
+        denom = hh - ll
+        if denom == 0:
+            continue
+        k[i] = (c[i] - ll) / denom * 100.0
+    return k
+
+
+def _true_range_loop(h, l, c):
+    n = c.size
+    tr = np.empty(n, dtype=np.float64)
+    tr[0] = h[0] - l[0]
+    for i in range(1, n):
+        tr[i] = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+    return tr
+
+
+def _directional_movement_loop(h, l):
+    n = h.size
+    plus_dm = np.zeros(n, dtype=np.float64)
+    minus_dm = np.zeros(n, dtype=np.float64)
+    for i in range(1, n):
+        up = h[i] - h[i - 1]
+        down = l[i - 1] - l[i]
+        plus_dm[i] = up if up > down and up > 0 else 0.0
+        minus_dm[i] = down if down > up and down > 0 else 0.0
+    return plus_dm, minus_dm
+
+
+def _supertrend_loop(c, upper, lower, atr_vals):
+    n = c.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    direction = 1
+    for i in range(n):
+        if math.isnan(atr_vals[i]):
+            continue
+        if i == 0:
+            out[i] = upper[i]
+            continue
+        if c[i] > upper[i - 1]:
+            direction = 1
+        elif c[i] < lower[i - 1]:
+            direction = -1
+        if direction > 0:
+            out[i] = max(lower[i], out[i - 1] if not math.isnan(out[i - 1]) else lower[i])
+        else:
+            out[i] = min(upper[i], out[i - 1] if not math.isnan(out[i - 1]) else upper[i])
+    return out
+
+
+def _psar_loop(h, l, accel, max_accel):
+    n = h.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    uptrend = True
+    ep = h[0]
+    sar = l[0]
+    af = accel
+    out[0] = sar
+    for i in range(1, n):
+        sar = sar + af * (ep - sar)
+        if uptrend:
+            sar = min(sar, l[i - 1], l[i])
+            if h[i] > ep:
+                ep = h[i]
+                af = min(af + accel, max_accel)
+            if l[i] < sar:
+                uptrend = False
+                sar = ep
+                ep = l[i]
+                af = accel
+        else:
+            sar = max(sar, h[i - 1], h[i])
+            if l[i] < ep:
+                ep = l[i]
+                af = min(af + accel, max_accel)
+            if h[i] > sar:
+                uptrend = True
+                sar = ep
+                ep = h[i]
+                af = accel
+        out[i] = sar
+    return out
+
+
+def _vwma_loop(arr, vol, length):
+    n = arr.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    for i in range(length - 1, n):
+        num = 0.0
+        denom = 0.0
+        gap = False
+        for j in range(i + 1 - length, i + 1):
+            p = arr[j]
+            v = vol[j]
+            if math.isnan(p) or math.isnan(v):
+                gap = True
+                break
+            num += p * v
+            denom += v
+        if gap or denom == 0:
+            continue
+        out[i] = num / denom
+    return out
+
+
+def _cci_loop(tp, ma, length):
+    n = tp.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    for i in range(length - 1, n):
+        m = ma[i]
+        if math.isnan(m):
+            continue
+        acc = 0.0
+        gap = False
+        for j in range(i + 1 - length, i + 1):
+            x = tp[j]
+            if math.isnan(x):
+                gap = True
+                break
+            acc += abs(x - m)
+        if gap:
+            continue
+        dev = acc / length
+        if dev == 0:
+            continue
+        out[i] = (tp[i] - m) / (0.015 * dev)
+    return out
+
+
+def _window_extreme_loop(arr, length, want_max):
+    n = arr.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    for i in range(length - 1, n):
+        if want_max:
+            out[i] = np.nanmax(arr[i + 1 - length: i + 1])
+        else:
+            out[i] = np.nanmin(arr[i + 1 - length: i + 1])
+    return out
+
+
+if njit is not None:
+    _smooth_loop = njit(cache=True)(_smooth_loop)
+    _wma_loop = njit(cache=True)(_wma_loop)
+    _stdev_loop = njit(cache=True)(_stdev_loop)
+    _stoch_k_loop = njit(cache=True)(_stoch_k_loop)
+    _true_range_loop = njit(cache=True)(_true_range_loop)
+    _directional_movement_loop = njit(cache=True)(_directional_movement_loop)
+    _supertrend_loop = njit(cache=True)(_supertrend_loop)
+    _psar_loop = njit(cache=True)(_psar_loop)
+    _window_extreme_loop = njit(cache=True)(_window_extreme_loop)
+    _vwma_loop = njit(cache=True)(_vwma_loop)
+    _cci_loop = njit(cache=True)(_cci_loop)
+
+
+def warmup() -> None:
+    """Compile the jitted kernels ahead of the first real compute; a no-op without numba."""
+    if njit is None:
+        return
+    # Row-major bars give strided columns; the chart's column buffer gives contiguous ones.
+    # Each layout is its own numba specialization, so both are exercised.
+    rows = np.linspace(1.0, 2.0, 32 * 6).reshape(32, 6)
+    cols = np.ascontiguousarray(rows.T)
+    for h, l, c in ((rows[:, 2], rows[:, 3], rows[:, 4]), (cols[2], cols[3], cols[4])):
+        ema(c, 5)
+        wma(c, 5)
+        stdev(c, 5)
+        highest(c, 5)
+        lowest(c, 5)
+        stoch(h, l, c, 5, 3)
+        dmi(h, l, c, 5)
+        supertrend(h, l, c, 5, 3.0)
+        psar(h, l, 0.02, 0.2)
+        vwma(c, 5, h)
+        cci(h, l, c, 5)
+
 
 @dataclass
 class SeriesBundle:
@@ -101,60 +335,24 @@ def sma(values: Iterable[float], length: int) -> np.ndarray:
 
 def ema(values: Iterable[float], length: int) -> np.ndarray:
     arr = np.asarray(values, dtype=np.float64)
-    n = arr.size
-    out = np.full(n, np.nan, dtype=np.float64)
-    if length <= 0 or n == 0:
-        return out
-    alpha = 2.0 / (length + 1.0)
-    ema_val = np.nan
-    for i in range(n):
-        v = arr[i]
-        if np.isnan(v):
-            out[i] = ema_val
-            continue
-        if np.isnan(ema_val):
-            ema_val = v
-        else:
-            ema_val = alpha * v + (1 - alpha) * ema_val
-        out[i] = ema_val
-    return out
+    if length <= 0 or arr.size == 0:
+        return np.full(arr.size, np.nan, dtype=np.float64)
+    return _smooth_loop(arr, 2.0 / (length + 1.0))
 
 
 def rma(values: Iterable[float], length: int) -> np.ndarray:
     arr = np.asarray(values, dtype=np.float64)
-    n = arr.size
-    out = np.full(n, np.nan, dtype=np.float64)
-    if length <= 0 or n == 0:
-        return out
-    alpha = 1.0 / float(length)
-    rma_val = np.nan
-    for i in range(n):
-        v = arr[i]
-        if np.isnan(v):
-            out[i] = rma_val
-            continue
-        if np.isnan(rma_val):
-            rma_val = v
-        else:
-            rma_val = alpha * v + (1 - alpha) * rma_val
-        out[i] = rma_val
-    return out
+    if length <= 0 or arr.size == 0:
+        return np.full(arr.size, np.nan, dtype=np.float64)
+    return _smooth_loop(arr, 1.0 / float(length))
 
 
 def wma(values: Iterable[float], length: int) -> np.ndarray:
     arr = np.asarray(values, dtype=np.float64)
-    n = arr.size
-    out = np.full(n, np.nan, dtype=np.float64)
-    if length <= 0 or n == 0:
-        return out
+    if length <= 0 or arr.size == 0:
+        return np.full(arr.size, np.nan, dtype=np.float64)
     weights = np.arange(1, length + 1, dtype=np.float64)
-    wsum = weights.sum()
-    for i in range(length - 1, n):
-        window = arr[i + 1 - length: i + 1]
-        if np.any(np.isnan(window)):
-            continue
-        out[i] = np.dot(window, weights) / wsum
-    return out
+    return _wma_loop(arr, weights, float(weights.sum()), length)
 
 
 def vwma(values: Iterable[float], length: int, volume: Optional[Iterable[float]] = None) -> np.ndarray:
@@ -164,16 +362,10 @@ def vwma(values: Iterable[float], length: int, volume: Optional[Iterable[float]]
     out = np.full(n, np.nan, dtype=np.float64)
     if length <= 0 or n == 0 or vol is None:
         return out
-    for i in range(length - 1, n):
-        p = arr[i + 1 - length: i + 1]
-        v = vol[i + 1 - length: i + 1]
-        if np.any(np.isnan(p)) or np.any(np.isnan(v)):
-            continue
-        denom = np.sum(v)
-        if denom == 0:
-            continue
-        out[i] = np.sum(p * v) / denom
-    return out
+    if vol.size < n:
+        # The kernel indexes both arrays by bar; a short volume array would be read out of bounds.
+        raise ValueError(f"vwma: volume has {vol.size} values, expected at least {n}")
+    return _vwma_loop(arr, vol[:n], length)
 
 
 def hma(values: Iterable[float], length: int) -> np.ndarray:
@@ -209,16 +401,10 @@ def stoch(high: Iterable[float], low: Iterable[float], close: Iterable[float], k
     l = np.asarray(low, dtype=np.float64)
     c = np.asarray(close, dtype=np.float64)
     n = c.size
-    k = np.full(n, np.nan, dtype=np.float64)
     if k_len <= 0 or n == 0:
+        k = np.full(n, np.nan, dtype=np.float64)
         return k, k.copy()
-    for i in range(k_len - 1, n):
-        hh = np.nanmax(h[i + 1 - k_len: i + 1])
-        ll = np.nanmin(l[i + 1 - k_len: i + 1])
-        denom = hh - ll
-        if denom == 0:
-            continue
-        k[i] = (c[i] - ll) / denom * 100.0
+    k = _stoch_k_loop(h, l, c, k_len)
     d = sma(k, d_len)
     return k, d
 
@@ -237,20 +423,9 @@ def cci(high: Iterable[float], low: Iterable[float], close: Iterable[float], len
     l = np.asarray(low, dtype=np.float64)
     c = np.asarray(close, dtype=np.float64)
     tp = (h + l + c) / 3.0
-    ma = sma(tp, length)
-    n = tp.size
-    out = np.full(n, np.nan, dtype=np.float64)
     if length <= 0:
-        return out
-    for i in range(length - 1, n):
-        window = tp[i + 1 - length: i + 1]
-        if np.any(np.isnan(window)) or np.isnan(ma[i]):
-            continue
-        dev = np.mean(np.abs(window - ma[i]))
-        if dev == 0:
-            continue
-        out[i] = (tp[i] - ma[i]) / (0.015 * dev)
-    return out
+        return np.full(tp.size, np.nan, dtype=np.float64)
+    return _cci_loop(tp, sma(tp, length), length)
 
 
 def momentum(values: Iterable[float], length: int) -> np.ndarray:
@@ -277,28 +452,16 @@ def atr(high: Iterable[float], low: Iterable[float], close: Iterable[float], len
     h = np.asarray(high, dtype=np.float64)
     l = np.asarray(low, dtype=np.float64)
     c = np.asarray(close, dtype=np.float64)
-    n = c.size
-    tr = np.full(n, np.nan, dtype=np.float64)
-    if n == 0:
-        return tr
-    tr[0] = h[0] - l[0]
-    for i in range(1, n):
-        tr[i] = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
-    return rma(tr, length)
+    if c.size == 0:
+        return np.full(0, np.nan, dtype=np.float64)
+    return rma(_true_range_loop(h, l, c), length)
 
 
 def stdev(values: Iterable[float], length: int) -> np.ndarray:
     arr = np.asarray(values, dtype=np.float64)
-    n = arr.size
-    out = np.full(n, np.nan, dtype=np.float64)
     if length <= 0:
-        return out
-    for i in range(length - 1, n):
-        window = arr[i + 1 - length: i + 1]
-        if np.any(np.isnan(window)):
-            continue
-        out[i] = np.std(window)
-    return out
+        return np.full(arr.size, np.nan, dtype=np.float64)
+    return _stdev_loop(arr, length)
 
 
 def bb(values: Iterable[float], length: int, mult: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -321,14 +484,7 @@ def dmi(high: Iterable[float], low: Iterable[float], close: Iterable[float], len
     h = np.asarray(high, dtype=np.float64)
     l = np.asarray(low, dtype=np.float64)
     c = np.asarray(close, dtype=np.float64)
-    n = c.size
-    plus_dm = np.zeros(n, dtype=np.float64)
-    minus_dm = np.zeros(n, dtype=np.float64)
-    for i in range(1, n):
-        up = h[i] - h[i - 1]
-        down = l[i - 1] - l[i]
-        plus_dm[i] = up if up > down and up > 0 else 0.0
-        minus_dm[i] = down if down > up and down > 0 else 0.0
+    plus_dm, minus_dm = _directional_movement_loop(h, l)
     tr = atr(h, l, c, 1)
     atr_vals = rma(tr, length)
     plus_di = 100 * rma(plus_dm, length) / atr_vals
@@ -346,66 +502,19 @@ def supertrend(high: Iterable[float], low: Iterable[float], close: Iterable[floa
     h = np.asarray(high, dtype=np.float64)
     l = np.asarray(low, dtype=np.float64)
     c = np.asarray(close, dtype=np.float64)
-    n = c.size
-    out = np.full(n, np.nan, dtype=np.float64)
     atr_vals = atr(h, l, c, length)
     hl2 = (h + l) / 2.0
     upper = hl2 + mult * atr_vals
     lower = hl2 - mult * atr_vals
-    direction = 1
-    for i in range(n):
-        if np.isnan(atr_vals[i]):
-            continue
-        if i == 0:
-            out[i] = upper[i]
-            continue
-        if c[i] > upper[i - 1]:
-            direction = 1
-        elif c[i] < lower[i - 1]:
-            direction = -1
-        if direction > 0:
-            out[i] = max(lower[i], out[i - 1] if not np.isnan(out[i - 1]) else lower[i])
-        else:
-            out[i] = min(upper[i], out[i - 1] if not np.isnan(out[i - 1]) else upper[i])
-    return out
+    return _supertrend_loop(c, upper, lower, atr_vals)
 
 
 def psar(high: Iterable[float], low: Iterable[float], accel: float, max_accel: float) -> np.ndarray:
     h = np.asarray(high, dtype=np.float64)
     l = np.asarray(low, dtype=np.float64)
-    n = h.size
-    out = np.full(n, np.nan, dtype=np.float64)
-    if n == 0:
-        return out
-    uptrend = True
-    ep = h[0]
-    sar = l[0]
-    af = accel
-    out[0] = sar
-    for i in range(1, n):
-        sar = sar + af * (ep - sar)
-        if uptrend:
-            sar = min(sar, l[i - 1], l[i])
-            if h[i] > ep:
-                ep = h[i]
-                af = min(af + accel, max_accel)
-            if l[i] < sar:
-                uptrend = False
-                sar = ep
-                ep = l[i]
-                af = accel
-        else:
-            sar = max(sar, h[i - 1], h[i])
-            if l[i] < ep:
-                ep = l[i]
-                af = min(af + accel, max_accel)
-            if h[i] > sar:
-                uptrend = True
-                sar = ep
-                ep = h[i]
-                af = accel
-        out[i] = sar
-    return out
+    if h.size == 0:
+        return np.full(0, np.nan, dtype=np.float64)
+    return _psar_loop(h, l, float(accel), float(max_accel))
 
 
 def cross(a: Iterable[float], b: Iterable[float]) -> np.ndarray:
@@ -440,24 +549,16 @@ def crossunder(a: Iterable[float], b: Iterable[float]) -> np.ndarray:
 
 def highest(values: Iterable[float], length: int) -> np.ndarray:
     arr = np.asarray(values, dtype=np.float64)
-    n = arr.size
-    out = np.full(n, np.nan, dtype=np.float64)
     if length <= 0:
-        return out
-    for i in range(length - 1, n):
-        out[i] = np.nanmax(arr[i + 1 - length: i + 1])
-    return out
+        return np.full(arr.size, np.nan, dtype=np.float64)
+    return _window_extreme_loop(arr, length, True)
 
 
 def lowest(values: Iterable[float], length: int) -> np.ndarray:
     arr = np.asarray(values, dtype=np.float64)
-    n = arr.size
-    out = np.full(n, np.nan, dtype=np.float64)
     if length <= 0:
-        return out
-    for i in range(length - 1, n):
-        out[i] = np.nanmin(arr[i + 1 - length: i + 1])
-    return out
+        return np.full(arr.size, np.nan, dtype=np.float64)
+    return _window_extreme_loop(arr, length, False)
 
 
 def percentile(values: Iterable[float], length: int, p: float) -> np.ndarray:
@@ -39,6 +39,10 @@ class IndicatorRenderer:
         self._series_cache: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
         self._max_points = 1500
 
+    @property
+    def item_count(self) -> int:
+        return len(self._items)
+
     def _downsample(self, times: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         if times.size <= self._max_points:
             return times, values
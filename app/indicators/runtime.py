@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -204,10 +204,16 @@ class IndicatorContext:
 
 
 def run_compute(
-    bars: List[Iterable[float]],
+    bars: Union[List[Iterable[float]], np.ndarray],
     params: Dict[str, Any],
     compute_fn,
 ) -> Tuple[Dict[str, Any], int]:
+    if isinstance(bars, np.ndarray) and bars.ndim == 2 and bars.shape[1] >= 6:
+        # Already columnar float64 (e.g. a transposed view of the chart's OHLCV buffer).
+        bars_np = bars[:, :6]
+        ctx = IndicatorContext(bars_np)
+        result = compute_fn(bars_np, params, ctx)
+        return result, ctx.required_lookback
     normalized: List[Iterable[float]]
     if isinstance(bars, list) and bars:
         first = bars[0]
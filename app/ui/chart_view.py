@@ -1,10 +1,16 @@
 import json
 import os
+import threading
 import time
 import uuid
+from array import array
 from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple, Callable
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Callable, Deque
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, QLabel, QCompleter, QButtonGroup, QTabBar, QStyle, QLineEdit, QMenu
@@ -24,8 +30,118 @@ from core.strategies.models import RunConfig
 from .theme import theme
 from .charts.candlestick_chart import CandlestickChart
 from indicators.runtime import run_compute
+from indicators.helpers import warmup as warmup_indicator_kernels
 from indicators.renderer import IndicatorRenderer
 
+# Array keys stripped from output specs before their styling is kept as cache meta.
+_META_EXCLUDE_VALUES = frozenset({"values"})
+_META_EXCLUDE_BANDS = frozenset({"upper", "lower"})
+
+# Higher wins when several recompute requests are coalesced into one pass.
+_RECOMPUTE_REASON_PRIORITY = {"live": 0, "view": 1, "close": 2, "params": 3}
+
+# Resolved once at import; every ChartView (one per tab) shares them.
+_UI_DIR = os.path.dirname(os.path.abspath(__file__))
+_APP_DIR = os.path.dirname(_UI_DIR)
+_THEME_DIR = os.path.join(_UI_DIR, 'theme')
+_DB_PATH = os.path.join(_APP_DIR, 'data', 'ohlcv.sqlite')
+_STRATEGY_DB_PATH = os.path.join(_APP_DIR, 'data', 'strategy.sqlite')
+_INDICATOR_BUILTINS_PATH = os.path.join(_APP_DIR, 'indicators', 'builtins')
+_INDICATOR_CUSTOM_PATH = os.path.join(_APP_DIR, 'indicators', 'custom')
+_STRATEGY_BUILTINS_PATH = os.path.join(_APP_DIR, 'strategies', 'builtins')
+_STRATEGY_CUSTOM_PATH = os.path.join(_APP_DIR, 'strategies', 'custom')
+
+# Vertical background gradient shared by the price plot and every indicator pane.
+_PLOT_BACKGROUND_GRADIENT = QLinearGradient(0, 0, 0, 1)
+_PLOT_BACKGROUND_GRADIENT.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+_PLOT_BACKGROUND_GRADIENT.setColorAt(0.0, QColor('#141A26'))
+_PLOT_BACKGROUND_GRADIENT.setColorAt(1.0, QColor('#101520'))
+_PLOT_BACKGROUND_BRUSH = QBrush(_PLOT_BACKGROUND_GRADIENT)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback.
+    orjson = None
+
+try:
+    import websocket
+except ImportError:  # Live streaming is disabled without websocket-client.
+    websocket = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy paths below are the fallback.
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _range_all_true(mask, start_idx, end_idx):
+        # Short-circuits on the first uncached bar without allocating a slice.
+        for i in range(start_idx, end_idx):
+            if not mask[i]:
+                return False
+        return True
+else:
+    _range_all_true = None
+
+
+def _warmup_kernels() -> None:
+    warmup_indicator_kernels()
+    if _range_all_true is not None:
+        # Same argument types as _is_range_cached, so the cache check never compiles on the GUI thread.
+        _range_all_true(np.ones(4, dtype=bool), 0, 4)
+
+
+def _json_dumps(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _monotonic_ms() -> int:
+    # For durations and throttles only; bar timestamps and DB rows stay on wall-clock time.
+    return time.monotonic_ns() // 1_000_000
+
+
+def _run_websocket_forever(ws, stop_event: threading.Event) -> None:
+    # Reconnect after every drop, backing off 1 s .. 30 s so a flapping or
+    # rate-limited endpoint isn't hammered; a connection that stayed up resets the delay.
+    backoff_s = 1.0
+    while not stop_event.is_set():
+        started = time.monotonic()
+        ws.run_forever(ping_interval=20, ping_timeout=10)
+        if stop_event.is_set():
+            break
+        if time.monotonic() - started > 60.0:
+            backoff_s = 1.0
+        stop_event.wait(backoff_s)
+        backoff_s = min(backoff_s * 2.0, 30.0)
+
+
+@lru_cache(maxsize=512)
+def _fmt_ts_ms(ts_ms: int) -> str:
+    # The debug panel re-formats the same cache/window/history bounds on every refresh.
+    try:
+        return datetime.fromtimestamp(ts_ms / 1000.0).strftime('%Y-%m-%d %H:%M:%S')
+    except Exception:
+        return str(ts_ms)
+
+
+@lru_cache(maxsize=None)
+def _theme_icon(name: str) -> QIcon:
+    # QIcon needs a QApplication, so icons are loaded on first use rather than at import.
+    return QIcon(os.path.join(_THEME_DIR, name))
+
 
 class TimeScaleViewBox(pg.ViewBox):
     def wheelEvent(self, ev) -> None:
@@ -43,7 +159,8 @@ class TimeScaleViewBox(pg.ViewBox):
 
 
 class DataFetchWorker(QThread):
-    data_ready = pyqtSignal(list)
+    # object, not list: a list signal round-trips every row through QVariant on emit.
+    data_ready = pyqtSignal(object)
     error = pyqtSignal(str)
 
     def __init__(
@@ -108,7 +225,7 @@ class DataFetchWorker(QThread):
 
 
 class SymbolFetchWorker(QThread):
-    data_ready = pyqtSignal(list)
+    data_ready = pyqtSignal(object)
     error = pyqtSignal(str)
 
     def __init__(self, store: DataStore, exchange: str) -> None:
@@ -143,6 +260,117 @@ class HistoryProbeWorker(QThread):
             self.error.emit(str(exc))
 
 
+class CacheStateWorker(QThread):
+    result = pyqtSignal(object, object)
+
+    def __init__(self, store: DataStore, exchange: str, symbol: str, timeframe: str, key: tuple) -> None:
+        super().__init__()
+        self.store = store
+        self.exchange = exchange
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.key = key
+
+    def run(self) -> None:
+        try:
+            state = self.store.get_cache_state(self.exchange, self.symbol, self.timeframe)
+        except Exception:
+            state = (None, None, False)
+        self.result.emit(self.key, state)
+
+
+class PerfRing:
+    """Fixed-capacity ring of (monotonic ts, ms) samples with a running sum and max."""
+
+    __slots__ = ("ts", "ms", "head", "count", "total", "peak")
+
+    def __init__(self, capacity: int) -> None:
+        # Two flat typed arrays instead of a tuple per sample; the oldest entry is overwritten when full.
+        self.ts = array('d', [0.0]) * capacity
+        self.ms = array('q', [0]) * capacity
+        self.head = 0
+        self.count = 0
+        self.total = 0
+        # None means the max was evicted and is rebuilt on the next summary.
+        self.peak: Optional[int] = 0
+
+    def push(self, now: float, ms: int) -> None:
+        capacity = len(self.ms)
+        if self.count == capacity:
+            self._drop_oldest()
+        idx = (self.head + self.count) % capacity
+        self.ts[idx] = now
+        self.ms[idx] = ms
+        self.count += 1
+        self.total += ms
+        if self.count == 1:
+            self.peak = ms
+        elif self.peak is not None and ms > self.peak:
+            self.peak = ms
+
+    def _drop_oldest(self) -> None:
+        ms = self.ms[self.head]
+        self.head = (self.head + 1) % len(self.ms)
+        self.count -= 1
+        self.total -= ms
+        if ms == self.peak:
+            self.peak = None
+
+    def prune(self, cutoff: float) -> None:
+        # Samples arrive in time order, so expired ones are always at the head.
+        while self.count and self.ts[self.head] < cutoff:
+            self._drop_oldest()
+
+    def summary(self) -> tuple[float, int, int]:
+        if not self.count:
+            return 0.0, 0, 0
+        if self.peak is None:
+            capacity = len(self.ms)
+            self.peak = max(self.ms[(self.head + i) % capacity] for i in range(self.count))
+        return float(self.total) / float(self.count), int(self.peak), self.count
+
+
+@dataclass(slots=True)
+class IndicatorResult:
+    instance_id: str
+    pane_id: str
+    output: Dict[str, Any]
+    required: int
+    bars: Any
+    times: Optional[np.ndarray]
+    view_key: Optional[tuple]
+    view_idx_key: Optional[tuple]
+    merge: bool
+    tail_len: int
+    bars_key: Optional[tuple]
+    bars_len: int
+    compute_start_idx: Optional[int]
+    compute_end_idx: Optional[int]
+    reason: str
+
+
+@dataclass(slots=True)
+class IndicatorInstance:
+    instance_id: str
+    indicator_id: str
+    name: str
+    pane_id: str
+    params: Dict[str, Any]
+    visible: bool
+    sort_index: int
+    schema: Dict[str, Any]
+    info: IndicatorInfo
+    compute_fn: Optional[Callable] = None
+    required_lookback: int = 0
+    last_output: Optional[Dict[str, Any]] = None
+    last_view_key: Optional[tuple] = None
+    last_view_idx_key: Optional[tuple] = None
+
+    def set_info(self, info: IndicatorInfo) -> None:
+        self.info = info
+        self.compute_fn = getattr(info.module, "compute", None)
+
+
 class IndicatorComputeWorker(QThread):
     result = pyqtSignal(int, list)
     error = pyqtSignal(str)
@@ -159,32 +387,48 @@ class IndicatorComputeWorker(QThread):
             for task in self._tasks:
                 instance_id = task.get("instance_id")
                 compute_fn = task.get("compute_fn")
-                bars = task.get("compute_bars") or task.get("bars")
+                bars = task.get("compute_bars")
                 params = task.get("params", {})
-                if compute_fn is None or not bars:
+                if compute_fn is None or bars is None or len(bars) == 0:
                     continue
                 output, required = run_compute(bars, params, compute_fn)
                 output = self._prep_output_arrays(output or {})
-                results.append({
-                    "instance_id": instance_id,
-                    "output": output or {},
-                    "required": required,
-                    "pane_id": task.get("pane_id", "price"),
-                    "view_key": task.get("view_key"),
-                    "view_idx_key": task.get("view_idx_key"),
-                    "bars": task.get("render_bars") or bars,
-                    "merge": bool(task.get("merge")),
-                    "tail_len": int(task.get("tail_len") or 0),
-                    "bars_key": task.get("bars_key"),
-                    "compute_start_idx": task.get("compute_start_idx"),
-                    "compute_end_idx": task.get("compute_end_idx"),
-                    "reason": self._reason,
-                })
+                render_bars = task.get("render_bars")
+                if render_bars is None or len(render_bars) == 0:
+                    render_bars = bars
+                results.append(IndicatorResult(
+                    instance_id=str(instance_id),
+                    pane_id=str(task.get("pane_id", "price")),
+                    output=output or {},
+                    required=int(required or 0),
+                    bars=render_bars,
+                    times=self._bar_times(render_bars, task.get("render_times")),
+                    view_key=task.get("view_key"),
+                    view_idx_key=task.get("view_idx_key"),
+                    merge=bool(task.get("merge")),
+                    tail_len=int(task.get("tail_len") or 0),
+                    bars_key=task.get("bars_key"),
+                    bars_len=int(task.get("bars_len") or len(render_bars)),
+                    compute_start_idx=task.get("compute_start_idx"),
+                    compute_end_idx=task.get("compute_end_idx"),
+                    reason=self._reason,
+                ))
         except Exception as exc:
             self.error.emit(str(exc))
             return
         self.result.emit(self._seq, results)
 
+    @staticmethod
+    def _bar_times(bars: Any, times: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        if isinstance(times, np.ndarray) and times.size == len(bars):
+            return times
+        try:
+            if isinstance(bars, np.ndarray):
+                return np.ascontiguousarray(bars[:, 0], dtype=np.float64)
+            return np.fromiter((float(b[0]) for b in bars), dtype=np.float64, count=len(bars))
+        except Exception:
+            return None
+
     @staticmethod
     def _prep_output_arrays(output: Dict[str, Any]) -> Dict[str, Any]:
         if not output:
@@ -267,7 +511,8 @@ class StrategyBacktestWorker(QThread):
             self.error.emit(str(exc))
 
 class CandleNormalizeWorker(QThread):
-    result = pyqtSignal(int, list, list, int)
+    # `object` hands the rows over by reference; a `list` signal deep-converts them through QVariantList.
+    result = pyqtSignal(int, object, int)
     error = pyqtSignal(str)
 
     def __init__(self, data: list, auto_range: bool, seq: int) -> None:
@@ -293,8 +538,7 @@ class CandleNormalizeWorker(QThread):
                 except (ValueError, TypeError):
                     continue
                 normalized.append([ts, o, h, l, cl, vol])
-            ts_cache = [float(c[0]) for c in normalized]
-            self.result.emit(self._seq, normalized, ts_cache, int(self._auto_range))
+            self.result.emit(self._seq, normalized, int(self._auto_range))
         except Exception as exc:
             self.error.emit(str(exc))
 
@@ -356,12 +600,14 @@ class LiveKlineWorker(QThread):
         self.symbol = symbol
         self.timeframe = timeframe
         self._stop = False
+        self._stop_event = threading.Event()
         self._ws = None
         self._time_offset_ms = 0
         self._last_sync_ms = 0
 
     def stop(self) -> None:
         self._stop = True
+        self._stop_event.set()
         try:
             if self._ws is not None:
                 self._ws.close()
@@ -369,11 +615,8 @@ class LiveKlineWorker(QThread):
             pass
 
     def run(self) -> None:
-        try:
-            import websocket
-            import json
-        except Exception as exc:
-            self.error.emit(f'WebSocket dependency missing: {exc}')
+        if websocket is None:
+            self.error.emit('WebSocket dependency missing: websocket-client is not installed')
             return
 
         stream = f"{self.symbol.lower()}@kline_{self.timeframe}"
@@ -392,6 +635,7 @@ class LiveKlineWorker(QThread):
                 self._time_offset_ms = 0
 
         sync_time_offset()
+        loads = _json_loads
 
         def on_message(ws, message):
             if self._stop:
@@ -400,7 +644,7 @@ class LiveKlineWorker(QThread):
                 local_ms = int(time.time() * 1000)
                 if local_ms - self._last_sync_ms > 300_000:
                     sync_time_offset()
-                payload = json.loads(message)
+                payload = loads(message)
                 k = payload.get('k', {})
                 kline = {
                     'ts_ms': int(k.get('t', 0)),
@@ -426,50 +670,71 @@ class LiveKlineWorker(QThread):
             _ = (code, msg)
 
         self._ws = websocket.WebSocketApp(url, on_message=on_message, on_error=on_error, on_close=on_close)
-        while not self._stop:
-            self._ws.run_forever(ping_interval=20, ping_timeout=10)
+        _run_websocket_forever(self._ws, self._stop_event)
 
 
 class LiveTradeWorker(QThread):
-    trade = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, symbol: str) -> None:
+    def __init__(self, symbol: str, timeframe_ms: int) -> None:
         super().__init__()
         self.symbol = symbol
+        self.timeframe_ms = max(1, int(timeframe_ms))
         self._stop = False
+        self._stop_event = threading.Event()
         self._ws = None
+        # Trades merged since the GUI last drained them (last price, high/low, summed qty),
+        # one entry per bar bucket so a batch never straddles a bar boundary.
+        self._pending: List[dict] = []
+        self._pending_lock = threading.Lock()
 
     def stop(self) -> None:
         self._stop = True
+        self._stop_event.set()
         try:
             if self._ws is not None:
                 self._ws.close()
         except Exception:
             pass
 
+    def take_pending(self) -> List[dict]:
+        with self._pending_lock:
+            trades = self._pending
+            self._pending = []
+        return trades
+
     def run(self) -> None:
-        try:
-            import websocket
-            import json
-        except Exception as exc:
-            self.error.emit(f'WebSocket dependency missing: {exc}')
+        if websocket is None:
+            self.error.emit('WebSocket dependency missing: websocket-client is not installed')
             return
 
         stream = f"{self.symbol.lower()}@aggTrade"
         url = f"wss://stream.binance.com:9443/ws/{stream}"
+        loads = _json_loads
+        lock = self._pending_lock
+        tf_ms = self.timeframe_ms
 
         def on_message(ws, message):
             if self._stop:
                 return
             try:
-                payload = json.loads(message)
-                trade = {
-                    'ts_ms': int(payload.get('T', 0)),
-                    'price': float(payload.get('p', 0)),
-                    'qty': float(payload.get('q', 0)),
-                }
-                self.trade.emit(trade)
+                payload = loads(message)
+                ts_ms = int(payload.get('T', 0))
+                price = float(payload.get('p', 0))
+                qty = float(payload.get('q', 0))
+                with lock:
+                    batches = self._pending
+                    pending = batches[-1] if batches else None
+                    if pending is None or ts_ms // tf_ms != pending['ts_ms'] // tf_ms:
+                        batches.append({'ts_ms': ts_ms, 'price': price, 'qty': qty, 'high': price, 'low': price})
+                        return
+                    pending['ts_ms'] = ts_ms
+                    pending['price'] = price
+                    pending['qty'] += qty
+                    if price > pending['high']:
+                        pending['high'] = price
+                    if price < pending['low']:
+                        pending['low'] = price
             except Exception as exc:
                 self.error.emit(str(exc))
 
@@ -478,8 +743,7 @@ class LiveTradeWorker(QThread):
                 self.error.emit(str(err))
 
         self._ws = websocket.WebSocketApp(url, on_message=on_message, on_error=on_error)
-        while not self._stop:
-            self._ws.run_forever(ping_interval=20, ping_timeout=10)
+        _run_websocket_forever(self._ws, self._stop_event)
 
 
 class ChartView(QWidget):
@@ -507,6 +771,11 @@ class ChartView(QWidget):
         self.timeframe_group = QButtonGroup(self)
         self.timeframe_group.setExclusive(True)
         self.current_timeframe = '1m'
+        # Symbol/timeframe of the data on the chart; set on every load so hot paths skip the Qt round-trip.
+        self._active_symbol = 'BTCUSDT'
+        self._active_timeframe = self.current_timeframe
+        # Bar length of the active timeframe, mirrored from the chart for the view/backfill paths.
+        self._tf_ms = 60_000
         for tf in ['1m', '5m', '15m', '1h', '4h', '1d', '1w', '1M']:
             button = QPushButton(tf)
             button.setCheckable(True)
@@ -520,8 +789,7 @@ class ChartView(QWidget):
         self.load_button = QPushButton('Reset Cache')
         self.load_button.setToolTip('Reset Cache')
         try:
-            icon_path = os.path.join(os.path.dirname(__file__), 'theme', 'icon_refresh.svg')
-            icon = QIcon(icon_path)
+            icon = _theme_icon('icon_refresh.svg')
             if icon.isNull():
                 icon = self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
             self.load_button.setIcon(icon)
@@ -559,11 +827,7 @@ class ChartView(QWidget):
 
         view_box = TimeScaleViewBox()
         self.plot_widget = pg.PlotWidget(viewBox=view_box)
-        gradient = QLinearGradient(0, 0, 0, 1)
-        gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-        gradient.setColorAt(0.0, QColor('#141A26'))
-        gradient.setColorAt(1.0, QColor('#101520'))
-        self.plot_widget.setBackground(QBrush(gradient))
+        self.plot_widget.setBackground(_PLOT_BACKGROUND_BRUSH)
         self.plot_widget.showGrid(x=True, y=True, alpha=0.2)
         self.plot_widget.setClipToView(True)
         self.plot_widget.setStyleSheet("border: 0px;")
@@ -578,6 +842,12 @@ class ChartView(QWidget):
         except Exception:
             pass
 
+        # Axis pens and font are built once and shared by the main plot and every indicator pane.
+        axis_font = QFont()
+        axis_font.setPointSize(8)
+        self._axis_pen = pg.mkPen(theme.GRID)
+        self._axis_text_pen = pg.mkPen(theme.TEXT)
+        self._axis_font = axis_font
         self._apply_axis_style()
         self._ensure_grid_visible()
 
@@ -593,14 +863,29 @@ class ChartView(QWidget):
         self.strategy_report = strategy_report
 
         self.candles = CandlestickChart(self.plot_widget, theme.UP, theme.DOWN)
+        # Bound once; the live kline/trade slots call these on every tick.
+        self._update_live_kline = self.candles.update_live_kline
+        self._update_live_trade = self.candles.update_live_trade
         self._setup_data_store()
         self._setup_indicator_system()
         self._setup_strategy_system()
         self._load_symbols()
         self._debug_last_update = 0.0
+        self._debug_min_interval_s = 0.5
+        self._debug_state_enabled = True
+        self._debug_store_key: Optional[tuple] = None
+        self._debug_store_state: tuple = (None, None, False)
+        self._cache_state_worker: Optional[CacheStateWorker] = None
         self._tab_syncing = False
         self._skip_next_plus = False
+        # Position of the trailing '+' tab, kept in step with every insert/remove/move.
+        self._plus_index = -1
         self._settings = QSettings('TradingDashboard', 'TradingDashboard')
+        # Tab edits come in bursts (drags, timeframe clicks); write settings once they settle.
+        self._persist_debounce_timer = QTimer(self)
+        self._persist_debounce_timer.setSingleShot(True)
+        self._persist_debounce_timer.setInterval(250)
+        self._persist_debounce_timer.timeout.connect(self._do_persist_tabs)
         self.symbol_box.currentIndexChanged.connect(self._on_symbol_changed)
         self._add_symbol_search_icon()
 
@@ -609,8 +894,7 @@ class ChartView(QWidget):
         if line_edit is None:
             return
         try:
-            icon_path = os.path.join(os.path.dirname(__file__), 'theme', 'icon_search.svg')
-            icon = QIcon(icon_path)
+            icon = _theme_icon('icon_search.svg')
             if icon.isNull():
                 icon = self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView)
             action = line_edit.addAction(icon, QLineEdit.ActionPosition.LeadingPosition)
@@ -636,36 +920,43 @@ class ChartView(QWidget):
             pass
 
     def _apply_axis_style(self) -> None:
-        axis_pen = pg.mkPen(theme.GRID)
-        text_pen = pg.mkPen(theme.TEXT)
-        font = QFont()
-        font.setPointSize(8)
+        self._apply_axis_style_to_plot(self.plot_widget)
 
-        for axis_name in ('left', 'bottom', 'right'):
-            axis = self.plot_widget.getAxis(axis_name)
-            axis.setPen(axis_pen)
-            try:
-                axis.setTickPen(axis_pen)
-                axis.setStyle(tickPen=axis_pen)
-            except Exception:
-                pass
-            axis.setTextPen(text_pen)
-            axis.setTickFont(font)
 
     def _setup_data_store(self) -> None:
-        db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'ohlcv.sqlite')
-        db_path = os.path.abspath(db_path)
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.store = DataStore(db_path)
+        os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+        self.store = DataStore(_DB_PATH)
         self.exchange = 'binance'
         self._worker: Optional[DataFetchWorker] = None
         self._symbol_worker: Optional[SymbolFetchWorker] = None
-        self._history_probe_worker: Optional[HistoryProbeWorker] = None
+        # Probes are network-bound, so a few run side by side; the rest wait in the queue.
+        self._history_probe_workers: Dict[tuple[str, str], HistoryProbeWorker] = {}
+        self._history_probe_max_workers = 4
         self._history_probe_inflight: set[tuple[str, str]] = set()
-        self._history_probe_queue: List[tuple[str, str]] = []
+        self._history_probe_queue: Deque[tuple[str, str]] = deque()
+        # Mirrors _history_probe_queue so duplicate enqueues are a set lookup.
+        self._history_probe_queued: set[tuple[str, str]] = set()
+        # (symbol, timeframe) -> (probed_at monotonic ms, earliest_ms); fresh entries are not probed again.
+        self._history_probe_cache: Dict[tuple[str, str], tuple[int, Optional[int]]] = {}
+        self._history_probe_ttl_ms = 3_600_000
         self._kline_worker: Optional[LiveKlineWorker] = None
         self._trade_worker: Optional[LiveTradeWorker] = None
+        # Trades are merged on the socket thread and drained here once per frame, however fast they arrive.
+        self._trade_drain_timer = QTimer(self)
+        self._trade_drain_timer.setInterval(16)
+        self._trade_drain_timer.timeout.connect(self._drain_trades)
+        # Run state for the debug panel, kept from start()/finished so it never polls QThread.isRunning().
+        self._fetch_running = False
+        self._kline_running = False
+        self._trade_running = False
         self._symbol_filter = None
+        self._symbol_items: List[str] = []
+        # Keystrokes only record the text; the proxy filters once typing pauses.
+        self._pending_symbol_filter = ""
+        self._symbol_filter_timer = QTimer(self)
+        self._symbol_filter_timer.setSingleShot(True)
+        self._symbol_filter_timer.setInterval(80)
+        self._symbol_filter_timer.timeout.connect(self._apply_symbol_filter)
         self._auto_backfill_last = 0.0
         self._last_fetch_mode = 'load'
         self._backfill_pending = False
@@ -681,6 +972,12 @@ class ChartView(QWidget):
         self._view_idle_timer.setSingleShot(True)
         self._view_idle_timer.timeout.connect(self._on_view_idle)
         self._apply_idle_delay_ms = 200
+        # Range changes closer together than this are folded into one trailing call.
+        self._view_range_throttle_ms = 16
+        self._last_range_change_ms = 0
+        self._view_range_trailing_timer = QTimer(self)
+        self._view_range_trailing_timer.setSingleShot(True)
+        self._view_range_trailing_timer.timeout.connect(self._on_view_range_changed)
         self._pending_apply_bars: Optional[list] = None
         self._pending_apply_auto_range = False
         self._pending_backfill_view: Optional[tuple[float, float]] = None
@@ -699,24 +996,59 @@ class ChartView(QWidget):
         self._initial_load_pending = False
         self._pending_kline: Optional[dict] = None
         self._pending_trade: Optional[dict] = None
-        self._indicator_paths = [
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "indicators", "builtins")),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "indicators", "custom")),
-        ]
+        # Closed live bars waiting to be written, per (symbol, timeframe); flushed in one store_bars each.
+        self._pending_store_bars: Dict[Tuple[str, str], List[list]] = {}
+        self._store_bars_timer = QTimer(self)
+        self._store_bars_timer.setSingleShot(True)
+        self._store_bars_timer.setInterval(2000)
+        self._store_bars_timer.timeout.connect(self._flush_store_bars)
+        self._indicator_paths = [_INDICATOR_BUILTINS_PATH, _INDICATOR_CUSTOM_PATH]
         self._indicator_defs: Dict[str, IndicatorInfo] = {}
-        self._indicator_instances: List[Dict[str, object]] = []
+        self._indicator_schema_cache: Dict[str, Tuple[str, Dict[str, object]]] = {}
+        self._indicator_panel_refresh_pending = False
+        # instance_id -> (params_json, parsed params); params_json doubles as the invalidation key.
+        self._indicator_params_parse_cache: Dict[str, Tuple[str, Dict[str, object]]] = {}
+        # Sorted panel payload for _indicator_defs; reset whenever the defs are replaced.
+        self._indicator_available_cache: Optional[List[dict]] = None
+        # Last payloads pushed to the panel. Load/add/remove and schema swaps bump the revision
+        # (full list rebuild); in-place edits only mark their instance for panel.update_instance.
+        self._indicator_available_fp: Optional[tuple] = None
+        self._indicator_instances_fp: Optional[tuple] = None
+        self._indicator_instances_rev = 0
+        self._indicator_panel_dirty_ids: set[str] = set()
+        # Instances with unsaved changes; flushed to the store in one transaction.
+        self._indicator_persist_dirty: set[str] = set()
+        self._indicator_persist_timer = QTimer(self)
+        self._indicator_persist_timer.setSingleShot(True)
+        self._indicator_persist_timer.setInterval(150)
+        self._indicator_persist_timer.timeout.connect(self._flush_indicator_persist)
+        self._indicator_instances: List[IndicatorInstance] = []
+        # Lets pans skip recompute scheduling outright when every indicator is hidden.
+        self._indicator_visible_count = 0
+        # Mirrors _indicator_instances by instance_id for O(1) lookups.
+        self._indicator_by_id: Dict[str, IndicatorInstance] = {}
         self._indicator_renderers: Dict[str, IndicatorRenderer] = {
             "price": IndicatorRenderer(self.plot_widget.getPlotItem())
         }
         self._indicator_panes: Dict[str, pg.PlotWidget] = {"price": self.plot_widget}
         self._indicator_hot_reload: Optional[QtFsHotReload] = None
         self._indicator_recompute_pending = False
+        self._indicator_recompute_only: Optional[set[str]] = None
         self._indicator_recompute_timer = QTimer(self)
         self._indicator_recompute_timer.setSingleShot(True)
         self._indicator_recompute_timer.timeout.connect(self._do_recompute_indicators)
         self._indicator_recompute_debounce_ms = 100
+        self._indicator_recompute_reason = "view"
+        # Immediate requests land here so bursts within a frame collapse into one pass.
+        self._indicator_coalesce_timer = QTimer(self)
+        self._indicator_coalesce_timer.setSingleShot(True)
+        self._indicator_coalesce_timer.setInterval(16)
+        self._indicator_coalesce_timer.timeout.connect(self._do_recompute_indicators)
         self._indicator_max_compute_bars = 2000
-        self._indicator_times_cache: Dict[tuple, np.ndarray] = {}
+        self._indicator_output_memo_size = 32
+        self._indicator_meta_intern: Dict[tuple, Dict[str, Any]] = {}
+        self._indicator_times_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._indicator_times_cache_size = 32
         self._last_indicator_view_idx_key: Optional[Tuple[Optional[int], Optional[int]]] = None
         self._indicator_freeze_visible_bars = 1500
         self._indicator_idle_ms = 200
@@ -725,6 +1057,8 @@ class ChartView(QWidget):
         self._indicator_idle_timer.timeout.connect(self._on_indicator_idle)
         self._indicator_compute_worker: Optional[IndicatorComputeWorker] = None
         self._indicator_compute_pending = False
+        self._indicator_compute_pending_reason: Optional[str] = None
+        self._indicator_compute_pending_only: Optional[set[str]] = None
         self._indicator_last_output: Dict[str, Dict[str, object]] = {}
         self._indicator_cache: Dict[str, Dict[str, Any]] = {}
         self._indicator_compute_seq = 0
@@ -738,28 +1072,38 @@ class ChartView(QWidget):
         self._backfill_decision_last_ms = 0
         self._indicator_next_pane_index = 1
         self._last_live_indicator_ms = 0
-        self._strategy_paths = [
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "strategies", "builtins")),
-            os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "strategies", "custom")),
-        ]
+        self._strategy_paths = [_STRATEGY_BUILTINS_PATH, _STRATEGY_CUSTOM_PATH]
         self._strategy_defs: Dict[str, StrategyInfo] = {}
         self._strategy_hot_reload: Optional[QtFsHotReload] = None
         self._strategy_worker: Optional[StrategyBacktestWorker] = None
         self._strategy_cancel_requested = False
         self._strategy_store: Optional[StrategyStore] = None
+        self._schema_pool: Optional[ThreadPoolExecutor] = None
         self._active_strategy_report = None
         self._strategy_finish_in_progress = False
         self._last_visible_bars = 0
 
         # Rolling perf window (event-based) for debug dock budgeting.
         self._perf_window_s = 5.0
-        self._perf_samples: Dict[str, List[Tuple[float, int]]] = {}
+        self._perf_samples: Dict[str, PerfRing] = {}
+        # Ring capacity per key; a burst inside the window overwrites the oldest samples.
+        self._perf_max_samples = 512
         self._indicator_compute_last_ts: Optional[float] = None
         self._candle_normalize_last_ts: Optional[float] = None
         self._backfill_decision_last_ts: Optional[float] = None
         self._volume_prep_last_seen_ts: Optional[float] = None
 
     def _setup_indicator_system(self) -> None:
+        # JIT-compile the indicator and cache-check kernels in the background while the first fetch runs.
+        # A plain daemon thread rather than a QThread: a compile still running at exit is
+        # abandoned with the process. Failures are not caught here, so threading.excepthook
+        # (exception.log when launched via main.py) records a broken kernel at warmup.
+        self._indicator_warmup_thread: Optional[threading.Thread] = threading.Thread(
+            target=_warmup_kernels,
+            name='indicator-warmup',
+            daemon=True,
+        )
+        self._indicator_warmup_thread.start()
         self._load_indicator_definitions()
         self._load_indicator_instances()
         self._wire_indicator_panel()
@@ -791,7 +1135,8 @@ class ChartView(QWidget):
     def _load_indicator_definitions(self) -> None:
         indicators = discover_indicators(self._indicator_paths)
         self._indicator_defs = {info.indicator_id: info for info in indicators}
-        self._update_indicator_panel()
+        self._indicator_available_cache = None
+        self._schedule_indicator_panel_refresh()
 
     def _start_indicator_hot_reload(self) -> None:
         if self._indicator_hot_reload is not None:
@@ -814,7 +1159,7 @@ class ChartView(QWidget):
     def _start_indicator_compute_worker(self, tasks: list, reason: str) -> None:
         self._indicator_compute_seq += 1
         seq = self._indicator_compute_seq
-        self._indicator_compute_last_start = time.time()
+        self._indicator_compute_last_start = _monotonic_ms()
         worker = IndicatorComputeWorker(tasks, reason, seq)
         self._indicator_compute_worker = worker
         worker.result.connect(self._on_indicator_compute_result)
@@ -826,62 +1171,74 @@ class ChartView(QWidget):
         if seq != self._indicator_compute_seq:
             return
         if hasattr(self, "_indicator_compute_last_start"):
-            self._indicator_compute_last_ms = int((time.time() - self._indicator_compute_last_start) * 1000)
+            self._indicator_compute_last_ms = _monotonic_ms() - self._indicator_compute_last_start
             self._indicator_compute_last_ts = time.time()
             self._perf_note("indicator_compute", self._indicator_compute_last_ms)
         for result in results:
-            instance_id = str(result.get("instance_id"))
-            output = result.get("output") or {}
-            pane_id = result.get("pane_id", "price")
-            view_key = result.get("view_key")
-            view_idx_key = result.get("view_idx_key")
-            bars = result.get("bars") or []
-            merge = bool(result.get("merge"))
-            tail_len = int(result.get("tail_len") or 0)
-            bars_key = result.get("bars_key")
-            compute_start = result.get("compute_start_idx")
-            compute_end = result.get("compute_end_idx")
+            instance_id = result.instance_id
+            output = result.output
+            pane_id = result.pane_id
+            view_key = result.view_key
+            view_idx_key = result.view_idx_key
+            bars = result.bars
+            tail_len = result.tail_len
+            bars_key = result.bars_key
+            compute_start = result.compute_start_idx
+            compute_end = result.compute_end_idx
             instance = self._find_indicator_instance(instance_id)
             if instance is None:
                 continue
-            instance["required_lookback"] = result.get("required", 0)
-            instance["last_view_key"] = view_key
-            instance["last_view_idx_key"] = view_idx_key
-            if merge:
+            instance.required_lookback = result.required
+            instance.last_view_key = view_key
+            instance.last_view_idx_key = view_idx_key
+            if result.merge:
                 prev = self._indicator_last_output.get(instance_id)
                 output = self._merge_indicator_output(prev, output, tail_len)
                 if tail_len > 0:
                     output = dict(output)
                     output["_tail_len"] = tail_len
+            # Compute indices are relative to the full candle list, not the rendered view slice.
             if bars_key and compute_start is not None and compute_end is not None:
-                cache = self._ensure_indicator_cache(instance_id, bars_key, len(bars))
+                cache = self._ensure_indicator_cache(instance_id, bars_key, result.bars_len)
                 self._apply_output_to_cache(cache, output, compute_start, compute_end)
             elif bars_key:
-                self._ensure_indicator_cache(instance_id, bars_key, len(bars))
+                self._ensure_indicator_cache(instance_id, bars_key, result.bars_len)
             self._indicator_last_output[instance_id] = output
             renderer = self._indicator_renderers.get(pane_id)
             if renderer:
-                times = None
-                if view_key is not None:
-                    cached = self._indicator_times_cache.get(view_key)
-                    if cached is not None and cached.size == len(bars):
-                        times = cached
-                if times is None:
-                    try:
-                        times = np.asarray([float(b[0]) for b in bars], dtype=np.float64)
-                    except Exception:
-                        times = None
-                    if times is not None and view_key is not None:
-                        self._indicator_times_cache[view_key] = times
+                times = self._indicator_view_times(view_key, bars, result.times)
                 if times is not None:
                     renderer.render((bars, times), output or {}, namespace=instance_id)
                 else:
                     renderer.render(bars, output or {}, namespace=instance_id)
 
+    def _indicator_view_times(self, view_key: Optional[tuple], bars: Any, produced: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        key = (view_key, len(bars)) if view_key is not None else None
+        if key is not None:
+            cached = self._indicator_times_cache.get(key)
+            if cached is not None:
+                self._indicator_times_cache.move_to_end(key)
+                return cached
+        times = produced
+        if not isinstance(times, np.ndarray) or times.size != len(bars):
+            try:
+                times = np.asarray([float(b[0]) for b in bars], dtype=np.float64)
+            except Exception:
+                return None
+        if key is not None:
+            self._indicator_times_cache[key] = times
+            if len(self._indicator_times_cache) > self._indicator_times_cache_size:
+                self._indicator_times_cache.popitem(last=False)
+        return times
+
     def _on_indicator_compute_finished(self) -> None:
         if self._indicator_compute_pending:
             self._indicator_compute_pending = False
-            self._recompute_indicators(immediate=True, reason="view")
+            reason = self._indicator_compute_pending_reason or "view"
+            instance_ids = self._indicator_compute_pending_only
+            self._indicator_compute_pending_reason = None
+            self._indicator_compute_pending_only = None
+            self._recompute_indicators(immediate=True, reason=reason, instance_ids=instance_ids)
 
     def _merge_indicator_output(self, prev: Optional[Dict[str, Any]], new: Dict[str, Any], tail_len: int) -> Dict[str, Any]:
         if not prev or tail_len <= 0:
@@ -936,46 +1293,73 @@ class ChartView(QWidget):
     def _ensure_indicator_cache(self, instance_id: str, bars_key: Tuple[int, float, float], length: int) -> Dict[str, Any]:
         cache = self._indicator_cache.get(instance_id)
         if cache is None or cache.get("bars_key") != bars_key:
+            capacity = max(int(length), 1)
+            # Outputs of one kind share a (rows, capacity) matrix so range writes and grows are block copies.
             cache = {
                 "bars_key": bars_key,
                 "length": length,
-                "mask": np.zeros(length, dtype=bool),
-                "series": {},
+                "capacity": capacity,
+                "mask": np.zeros(capacity, dtype=bool),
+                "series_matrix": np.full((0, capacity), np.nan, dtype=np.float64),
+                "series_index": {},
                 "series_meta": {},
-                "bands": {},
+                "bands_matrix": np.full((0, 2, capacity), np.nan, dtype=np.float64),
+                "bands_index": {},
                 "bands_meta": {},
-                "hist": {},
+                "hist_matrix": np.full((0, capacity), np.nan, dtype=np.float64),
+                "hist_index": {},
                 "hist_meta": {},
                 "markers": [],
                 "regions": [],
                 "levels": [],
+                "version": 0,
+                "output_memo": OrderedDict(),
             }
             self._indicator_cache[instance_id] = cache
             return cache
         current_len = int(cache.get("length", 0) or 0)
         if current_len != length:
-            delta = length - current_len
-            if delta > 0:
-                cache["mask"] = np.concatenate([cache["mask"], np.zeros(delta, dtype=bool)])
-                for key, arr in cache["series"].items():
-                    cache["series"][key] = np.concatenate([arr, np.full(delta, np.nan)])
-                for key, band in cache["bands"].items():
-                    band["upper"] = np.concatenate([band["upper"], np.full(delta, np.nan)])
-                    band["lower"] = np.concatenate([band["lower"], np.full(delta, np.nan)])
-                for key, arr in cache["hist"].items():
-                    cache["hist"][key] = np.concatenate([arr, np.full(delta, np.nan)])
-            else:
-                cache["mask"] = cache["mask"][:length]
-                for key, arr in cache["series"].items():
-                    cache["series"][key] = arr[:length]
-                for key, band in cache["bands"].items():
-                    band["upper"] = band["upper"][:length]
-                    band["lower"] = band["lower"][:length]
-                for key, arr in cache["hist"].items():
-                    cache["hist"][key] = arr[:length]
+            capacity = int(cache.get("capacity", 0) or 0)
+            if length > capacity:
+                self._grow_indicator_cache(cache, max(int(length), capacity + capacity // 2))
+            elif length < current_len:
+                # Clear the dropped tail so a later regrow starts out uncached.
+                cache["mask"][length:current_len] = False
+                cache["series_matrix"][:, length:current_len] = np.nan
+                cache["bands_matrix"][:, :, length:current_len] = np.nan
+                cache["hist_matrix"][:, length:current_len] = np.nan
             cache["length"] = length
+            cache["version"] = int(cache.get("version", 0)) + 1
         return cache
 
+    @staticmethod
+    def _grow_indicator_cache(cache: Dict[str, Any], capacity: int) -> None:
+        length = int(cache.get("length", 0) or 0)
+        mask = np.zeros(capacity, dtype=bool)
+        mask[:length] = cache["mask"][:length]
+        cache["mask"] = mask
+        for key in ("series_matrix", "bands_matrix", "hist_matrix"):
+            old = cache[key]
+            grown = np.empty(old.shape[:-1] + (capacity,), dtype=np.float64)
+            np.copyto(grown[..., :length], old[..., :length])
+            grown[..., length:] = np.nan
+            cache[key] = grown
+        cache["capacity"] = capacity
+
+    @staticmethod
+    def _indicator_cache_row(cache: Dict[str, Any], kind: str, item_id: str) -> int:
+        index = cache[f"{kind}_index"]
+        row = index.get(item_id)
+        if row is None:
+            old = cache[f"{kind}_matrix"]
+            grown = np.empty((old.shape[0] + 1,) + old.shape[1:], dtype=np.float64)
+            grown[:old.shape[0]] = old
+            grown[old.shape[0]] = np.nan
+            cache[f"{kind}_matrix"] = grown
+            row = old.shape[0]
+            index[item_id] = row
+        return row
+
     @staticmethod
     def _is_range_cached(mask: np.ndarray, start_idx: Optional[int], end_idx: Optional[int]) -> bool:
         if start_idx is None or end_idx is None:
@@ -983,19 +1367,30 @@ class ChartView(QWidget):
         if end_idx <= start_idx:
             return False
         try:
+            if _range_all_true is not None:
+                return bool(_range_all_true(mask, max(0, int(start_idx)), min(int(end_idx), mask.size)))
             return bool(mask[start_idx:end_idx].all())
         except Exception:
             return False
 
     @staticmethod
     def _ensure_segment(values: Any, length: int) -> np.ndarray:
-        if isinstance(values, np.ndarray):
+        if isinstance(values, (np.ndarray, memoryview)):
+            # asarray honours the buffer's item format; frombuffer would reinterpret the raw bytes.
             arr = np.asarray(values, dtype=np.float64)
         else:
-            arr = np.asarray(list(values), dtype=np.float64)
+            if not hasattr(values, "__len__"):
+                values = list(values)
+            try:
+                arr = np.fromiter(values, dtype=np.float64, count=len(values))
+            except (TypeError, ValueError):
+                # fromiter rejects None; keep the old NaN coercion for such lists.
+                arr = np.asarray(list(values), dtype=np.float64)
         if arr.size < length:
-            pad = np.full(length - arr.size, np.nan, dtype=np.float64)
-            arr = np.concatenate([pad, arr])
+            padded = np.empty(length, dtype=np.float64)
+            padded[:length - arr.size] = np.nan
+            padded[length - arr.size:] = arr
+            arr = padded
         elif arr.size > length:
             arr = arr[-length:]
         return arr
@@ -1009,58 +1404,50 @@ class ChartView(QWidget):
         if end_idx <= start_idx:
             return
         seg_len = end_idx - start_idx
+        cache["version"] = int(cache.get("version", 0)) + 1
         cache["mask"][start_idx:end_idx] = True
         series = output.get("series")
         if isinstance(series, list):
+            rows = []
+            segments = []
             for spec in series:
                 if not isinstance(spec, dict):
                     continue
                 series_id = str(spec.get("id", "series"))
-                values = self._ensure_segment(spec.get("values", []), seg_len)
-                arr = cache["series"].get(series_id)
-                if arr is None or arr.size != length:
-                    arr = np.full(length, np.nan, dtype=np.float64)
-                arr[start_idx:end_idx] = values
-                cache["series"][series_id] = arr
-                meta = dict(spec)
-                meta.pop("values", None)
-                meta["id"] = series_id
-                cache["series_meta"][series_id] = meta
+                rows.append(self._indicator_cache_row(cache, "series", series_id))
+                segments.append(self._ensure_segment(spec.get("values", []), seg_len))
+                cache["series_meta"][series_id] = self._intern_output_meta(spec, _META_EXCLUDE_VALUES, series_id)
+            if rows:
+                cache["series_matrix"][rows, start_idx:end_idx] = np.stack(segments)
         bands = output.get("bands")
         if isinstance(bands, list):
+            rows = []
+            segments = []
             for spec in bands:
                 if not isinstance(spec, dict):
                     continue
                 band_id = str(spec.get("id", "band"))
-                upper = self._ensure_segment(spec.get("upper", []), seg_len)
-                lower = self._ensure_segment(spec.get("lower", []), seg_len)
-                band = cache["bands"].get(band_id)
-                if band is None or band.get("upper") is None or band["upper"].size != length:
-                    band = {"upper": np.full(length, np.nan, dtype=np.float64), "lower": np.full(length, np.nan, dtype=np.float64)}
-                band["upper"][start_idx:end_idx] = upper
-                band["lower"][start_idx:end_idx] = lower
-                cache["bands"][band_id] = band
-                meta = dict(spec)
-                meta.pop("upper", None)
-                meta.pop("lower", None)
-                meta["id"] = band_id
-                cache["bands_meta"][band_id] = meta
+                rows.append(self._indicator_cache_row(cache, "bands", band_id))
+                segments.append((
+                    self._ensure_segment(spec.get("upper", []), seg_len),
+                    self._ensure_segment(spec.get("lower", []), seg_len),
+                ))
+                cache["bands_meta"][band_id] = self._intern_output_meta(spec, _META_EXCLUDE_BANDS, band_id)
+            if rows:
+                cache["bands_matrix"][rows, :, start_idx:end_idx] = np.asarray(segments, dtype=np.float64)
         hist = output.get("hist")
         if isinstance(hist, list):
+            rows = []
+            segments = []
             for spec in hist:
                 if not isinstance(spec, dict):
                     continue
                 hist_id = str(spec.get("id", "hist"))
-                values = self._ensure_segment(spec.get("values", []), seg_len)
-                arr = cache["hist"].get(hist_id)
-                if arr is None or arr.size != length:
-                    arr = np.full(length, np.nan, dtype=np.float64)
-                arr[start_idx:end_idx] = values
-                cache["hist"][hist_id] = arr
-                meta = dict(spec)
-                meta.pop("values", None)
-                meta["id"] = hist_id
-                cache["hist_meta"][hist_id] = meta
+                rows.append(self._indicator_cache_row(cache, "hist", hist_id))
+                segments.append(self._ensure_segment(spec.get("values", []), seg_len))
+                cache["hist_meta"][hist_id] = self._intern_output_meta(spec, _META_EXCLUDE_VALUES, hist_id)
+            if rows:
+                cache["hist_matrix"][rows, start_idx:end_idx] = np.stack(segments)
         if output.get("markers") is not None:
             cache["markers"] = output.get("markers", [])
         if output.get("regions") is not None:
@@ -1068,33 +1455,74 @@ class ChartView(QWidget):
         if output.get("levels") is not None:
             cache["levels"] = output.get("levels", [])
 
+    def _intern_output_meta(self, spec: Dict[str, Any], exclude: frozenset, item_id: str) -> Dict[str, Any]:
+        meta = {k: v for k, v in spec.items() if k not in exclude}
+        meta["id"] = item_id
+        try:
+            key = (exclude, tuple(sorted(meta.items())))
+            hash(key)
+        except TypeError:
+            return meta
+        interned = self._indicator_meta_intern.get(key)
+        if interned is None:
+            if len(self._indicator_meta_intern) >= 512:
+                self._indicator_meta_intern.clear()
+            self._indicator_meta_intern[key] = meta
+            interned = meta
+        return interned
+
+    @staticmethod
+    def _readonly_view(arr: np.ndarray, start_idx: int, end_idx: int) -> np.ndarray:
+        view = arr[start_idx:end_idx]
+        view.setflags(write=False)
+        return view
+
     def _build_output_from_cache(self, cache: Dict[str, Any], start_idx: int, end_idx: int) -> Dict[str, Any]:
         start_idx = max(0, int(start_idx))
-        end_idx = max(start_idx, int(end_idx))
+        end_idx = max(start_idx, min(int(end_idx), int(cache.get("length", 0) or 0)))
+        # Panning back and forth over an unchanged cache reuses the same output dict.
+        memo = cache.get("output_memo")
+        memo_key = (int(cache.get("version", 0)), start_idx, end_idx)
+        if memo is not None:
+            hit = memo.get(memo_key)
+            if hit is not None:
+                memo.move_to_end(memo_key)
+                return hit
+        output = self._assemble_output_from_cache(cache, start_idx, end_idx)
+        if memo is not None:
+            memo[memo_key] = output
+            while len(memo) > self._indicator_output_memo_size:
+                memo.popitem(last=False)
+        return output
+
+    def _assemble_output_from_cache(self, cache: Dict[str, Any], start_idx: int, end_idx: int) -> Dict[str, Any]:
         series_specs = []
+        series_matrix = cache["series_matrix"]
         for series_id, meta in cache.get("series_meta", {}).items():
-            arr = cache["series"].get(series_id)
-            if arr is None:
+            row = cache["series_index"].get(series_id)
+            if row is None:
                 continue
             spec = dict(meta)
-            spec["values"] = arr[start_idx:end_idx]
+            spec["values"] = self._readonly_view(series_matrix[row], start_idx, end_idx)
             series_specs.append(spec)
         band_specs = []
+        bands_matrix = cache["bands_matrix"]
         for band_id, meta in cache.get("bands_meta", {}).items():
-            band = cache["bands"].get(band_id)
-            if band is None:
+            row = cache["bands_index"].get(band_id)
+            if row is None:
                 continue
             spec = dict(meta)
-            spec["upper"] = band["upper"][start_idx:end_idx]
-            spec["lower"] = band["lower"][start_idx:end_idx]
+            spec["upper"] = self._readonly_view(bands_matrix[row, 0], start_idx, end_idx)
+            spec["lower"] = self._readonly_view(bands_matrix[row, 1], start_idx, end_idx)
             band_specs.append(spec)
         hist_specs = []
+        hist_matrix = cache["hist_matrix"]
         for hist_id, meta in cache.get("hist_meta", {}).items():
-            arr = cache["hist"].get(hist_id)
-            if arr is None:
+            row = cache["hist_index"].get(hist_id)
+            if row is None:
                 continue
             spec = dict(meta)
-            spec["values"] = arr[start_idx:end_idx]
+            spec["values"] = self._readonly_view(hist_matrix[row], start_idx, end_idx)
             hist_specs.append(spec)
         output: Dict[str, Any] = {}
         if series_specs:
@@ -1112,16 +1540,29 @@ class ChartView(QWidget):
         return output
 
     def _on_indicators_updated(self, indicators: List[IndicatorInfo]) -> None:
+        old_defs = self._indicator_defs
         self._indicator_defs = {info.indicator_id: info for info in indicators}
-        self._indicator_cache.clear()
+        self._indicator_available_cache = None
+        changed_ids = set()
+        for indicator_id, info in self._indicator_defs.items():
+            prev = old_defs.get(indicator_id)
+            if prev is None or prev.module_hash != info.module_hash or prev.load_error != info.load_error:
+                changed_ids.add(indicator_id)
+                self._indicator_schema_cache.pop(indicator_id, None)
+        affected = set()
         for instance in self._indicator_instances:
-            indicator_id = instance.get("indicator_id")
-            info = self._indicator_defs.get(indicator_id)
+            info = self._indicator_defs.get(instance.indicator_id)
             if info:
-                instance["info"] = info
-                instance["schema"] = self._build_schema(info)
-        self._update_indicator_panel()
-        self._recompute_indicators(immediate=True, reason="params")
+                instance.set_info(info)
+                if instance.indicator_id in changed_ids:
+                    instance.schema = self._build_schema(info)
+                    self._clear_indicator_cache(instance.instance_id)
+                    affected.add(instance.instance_id)
+        if affected:
+            self._indicator_instances_rev += 1
+        self._schedule_indicator_panel_refresh()
+        if affected:
+            self._recompute_indicators(immediate=True, reason="params", instance_ids=affected)
 
     def _on_indicator_error(self, message: str) -> None:
         self._report_error(f'Indicator reload failed: {message}')
@@ -1164,35 +1605,52 @@ class ChartView(QWidget):
     def _on_strategy_error(self, message: str) -> None:
         self._report_error(f'Strategy reload failed: {message}')
 
+    @staticmethod
+    def _build_strategy_panel_item(info: StrategyInfo) -> Tuple[Optional[dict], Optional[str]]:
+        schema_fn = getattr(info.module, "schema", None)
+        if schema_fn is None:
+            return None, None
+        try:
+            schema = schema_fn()
+        except Exception:
+            return None, f"Strategy schema error: {info.strategy_id}"
+        ok, err = validate_schema(schema)
+        if not ok:
+            return None, f"Strategy schema invalid: {err}"
+        params = resolve_params(schema, {})
+        return {
+            "strategy_id": info.strategy_id,
+            "name": info.name,
+            "schema": schema,
+            "params": params,
+            "load_error": getattr(info, "load_error", None),
+        }, None
+
     def _build_strategy_panel_items(self) -> List[dict]:
-        items: List[dict] = []
-        for info in self._strategy_defs.values():
-            schema_fn = getattr(info.module, "schema", None)
-            if schema_fn is None:
-                continue
+        infos = list(self._strategy_defs.values())
+        built: List[Tuple[Optional[dict], Optional[str]]] = []
+        if len(infos) > 1:
             try:
-                schema = schema_fn()
+                if self._schema_pool is None:
+                    self._schema_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="strategy-schema")
+                futures = [self._schema_pool.submit(self._build_strategy_panel_item, info) for info in infos]
+                built = [future.result() for future in futures]
             except Exception:
-                self._report_error(f"Strategy schema error: {info.strategy_id}")
-                continue
-            ok, err = validate_schema(schema)
-            if not ok:
-                self._report_error(f"Strategy schema invalid: {err}")
-                continue
-            params = resolve_params(schema, {})
-            items.append({
-                "strategy_id": info.strategy_id,
-                "name": info.name,
-                "schema": schema,
-                "params": params,
-                "load_error": getattr(info, "load_error", None),
-            })
+                built = []
+        if not built:
+            built = [self._build_strategy_panel_item(info) for info in infos]
+        items: List[dict] = []
+        # Errors are reported here so the error dock is only touched from the GUI thread.
+        for item, error in built:
+            if error:
+                self._report_error(error)
+            if item is not None:
+                items.append(item)
         return items
 
     def _ensure_strategy_store(self) -> StrategyStore:
         if self._strategy_store is None:
-            path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "strategy.sqlite"))
-            self._strategy_store = StrategyStore(path)
+            self._strategy_store = StrategyStore(_STRATEGY_DB_PATH)
         return self._strategy_store
 
     def _on_strategy_run_requested(self, strategy_id: str, params: dict, run_cfg: dict) -> None:
@@ -1454,6 +1912,10 @@ class ChartView(QWidget):
                 except Exception:
                     pass
             self._strategy_finish_in_progress = False
+        if QThread.currentThread() == self.thread():
+            # Queued finished signals already land on the GUI thread; skip the extra event-loop hop.
+            _apply_report()
+            return
         try:
             QTimer.singleShot(0, _apply_report)
         except Exception:
@@ -1471,84 +1933,130 @@ class ChartView(QWidget):
         self.indicator_panel.indicator_reset_requested.connect(self._reset_indicator_defaults)
         self._update_indicator_panel()
 
+    def _schedule_indicator_panel_refresh(self) -> None:
+        # Bursts of instance edits collapse into one panel rebuild on the next event loop turn.
+        if self._indicator_panel_refresh_pending:
+            return
+        self._indicator_panel_refresh_pending = True
+        QTimer.singleShot(0, self._flush_indicator_panel_refresh)
+
+    def _flush_indicator_panel_refresh(self) -> None:
+        if self._indicator_panel_refresh_pending:
+            self._update_indicator_panel()
+
     def _update_indicator_panel(self) -> None:
+        self._indicator_panel_refresh_pending = False
         if self.indicator_panel is None:
             return
-        available = []
-        for info in self._indicator_defs.values():
-            available.append(
-                {
-                    "indicator_id": info.indicator_id,
-                    "name": info.name,
-                    "inputs": info.inputs,
-                    "pane": info.pane,
-                    "load_error": getattr(info, "load_error", None),
-                }
-            )
-        available.sort(key=lambda item: item["name"].lower())
-        self.indicator_panel.set_available_indicators(available)
+        available = self._indicator_available_cache
+        if available is None:
+            available = []
+            for info in self._indicator_defs.values():
+                available.append(
+                    {
+                        "indicator_id": info.indicator_id,
+                        "name": info.name,
+                        "inputs": info.inputs,
+                        "pane": info.pane,
+                        "load_error": getattr(info, "load_error", None),
+                    }
+                )
+            available.sort(key=lambda item: item["name"].casefold())
+            self._indicator_available_cache = available
+        available_fp = tuple((item["indicator_id"], item["name"], item["load_error"]) for item in available)
+        if available_fp != self._indicator_available_fp:
+            self._indicator_available_fp = available_fp
+            self.indicator_panel.set_available_indicators(available)
         pane_ids = self._current_pane_ids()
-        instances = []
-        for instance in self._indicator_instances:
-            instances.append(
-                {
-                    "instance_id": instance.get("instance_id"),
-                    "indicator_id": instance.get("indicator_id"),
-                    "name": instance.get("name"),
-                    "pane_id": instance.get("pane_id"),
-                    "params": instance.get("params"),
-                    "schema": instance.get("schema"),
-                    "visible": instance.get("visible", True),
-                }
-            )
+        instances_fp = (self._indicator_instances_rev, tuple(pane_ids))
+        dirty_ids = self._indicator_panel_dirty_ids
+        self._indicator_panel_dirty_ids = set()
+        if instances_fp == self._indicator_instances_fp:
+            for instance_id in dirty_ids:
+                instance = self._indicator_by_id.get(instance_id)
+                if instance is not None:
+                    self.indicator_panel.update_instance(self._indicator_panel_entry(instance))
+            return
+        self._indicator_instances_fp = instances_fp
+        instances = [self._indicator_panel_entry(instance) for instance in self._indicator_instances]
         self.indicator_panel.set_indicator_instances(instances, pane_ids)
 
+    def _indicator_panel_entry(self, instance: IndicatorInstance) -> dict:
+        return {
+            "instance_id": instance.instance_id,
+            "indicator_id": instance.indicator_id,
+            "name": instance.name,
+            "pane_id": instance.pane_id,
+            "params": instance.params,
+            "schema": instance.schema,
+            "visible": instance.visible,
+        }
+
     def _load_indicator_instances(self) -> None:
         if self.store is None:
             return
         rows = self.store.get_indicator_instances()
-        instances: List[Dict[str, object]] = []
+        instances: List[IndicatorInstance] = []
         for instance_id, indicator_id, pane_id, params_json, visible, sort_index in rows:
             info = self._indicator_defs.get(indicator_id)
             if info is None:
                 continue
             schema = self._build_schema(info)
-            params = self._merge_params(schema.get("inputs", {}), params_json)
+            params = self._merge_params(schema.get("inputs", {}), params_json, instance_id=str(instance_id))
             pane_id = self._normalize_pane_id(schema, pane_id)
-            self._ensure_indicator_pane(pane_id)
-            instances.append(
-                {
-                    "instance_id": instance_id,
-                    "indicator_id": indicator_id,
-                    "name": schema.get("name", indicator_id),
-                    "pane_id": pane_id,
-                    "params": params,
-                    "visible": visible,
-                    "sort_index": sort_index,
-                    "schema": schema,
-                    "info": info,
-                    "last_output": None,
-                }
+            # Hidden instances get their pane on first show; only reserve the id here.
+            if visible:
+                self._ensure_indicator_pane(pane_id)
+            else:
+                self._reserve_pane_id(pane_id)
+            instance = IndicatorInstance(
+                instance_id=str(instance_id),
+                indicator_id=str(indicator_id),
+                name=str(schema.get("name", indicator_id)),
+                pane_id=pane_id,
+                params=params,
+                visible=bool(visible),
+                sort_index=int(sort_index),
+                schema=schema,
+                info=info,
             )
+            instance.set_info(info)
+            instances.append(instance)
         self._indicator_instances = instances
+        self._indicator_visible_count = sum(1 for inst in instances if inst.visible)
+        self._indicator_by_id = {inst.instance_id: inst for inst in instances}
+        self._indicator_instances_rev += 1
 
     def _build_schema(self, info: IndicatorInfo) -> Dict[str, object]:
+        cached = self._indicator_schema_cache.get(info.indicator_id)
+        if cached is not None and cached[0] == info.module_hash:
+            return cached[1]
+        schema: Optional[Dict[str, object]] = None
         try:
             schema_fn = getattr(info.module, "schema", None)
             if schema_fn is not None:
-                schema = schema_fn()
-                if isinstance(schema, dict):
-                    return schema
+                result = schema_fn()
+                if isinstance(result, dict):
+                    schema = result
         except Exception:
             pass
-        return {"id": info.indicator_id, "name": info.name, "inputs": info.inputs, "pane": info.pane}
+        if schema is None:
+            schema = {"id": info.indicator_id, "name": info.name, "inputs": info.inputs, "pane": info.pane}
+        self._indicator_schema_cache[info.indicator_id] = (info.module_hash, schema)
+        return schema
 
-    def _merge_params(self, inputs: Dict[str, dict], params_json: str) -> Dict[str, object]:
+    def _merge_params(self, inputs: Dict[str, dict], params_json: str, instance_id: Optional[str] = None) -> Dict[str, object]:
         params: Dict[str, object] = {}
-        try:
-            params = json.loads(params_json) if params_json else {}
-        except Exception:
-            params = {}
+        cached = self._indicator_params_parse_cache.get(instance_id) if instance_id else None
+        if cached is not None and cached[0] == params_json:
+            params = dict(cached[1])
+        else:
+            try:
+                params = _json_loads(params_json) if params_json else {}
+            except Exception:
+                params = {}
+            if instance_id and isinstance(params, dict):
+                self._indicator_params_parse_cache[instance_id] = (params_json, dict(params))
         for key, spec in inputs.items():
             if key not in params and "default" in spec:
                 params[key] = spec["default"]
@@ -1565,24 +2073,25 @@ class ChartView(QWidget):
         return self._allocate_pane_id()
 
     def _allocate_pane_id(self) -> str:
-        while True:
-            pane_id = f"pane-{self._indicator_next_pane_index}"
-            self._indicator_next_pane_index += 1
-            if pane_id not in self._indicator_panes:
-                return pane_id
+        # Persisted pane ids advance the counter in _reserve_pane_id, so this never collides.
+        pane_id = f"pane-{self._indicator_next_pane_index}"
+        self._indicator_next_pane_index += 1
+        return pane_id
+
+    def _reserve_pane_id(self, pane_id: str) -> None:
+        prefix, _, suffix = pane_id.partition("-")
+        if prefix == "pane" and suffix.isdigit():
+            self._indicator_next_pane_index = max(self._indicator_next_pane_index, int(suffix) + 1)
 
     def _ensure_indicator_pane(self, pane_id: str) -> None:
         if pane_id == "price":
             return
         if pane_id in self._indicator_panes:
             return
+        self._reserve_pane_id(pane_id)
         view_box = pg.ViewBox()
         pane_plot = pg.PlotWidget(viewBox=view_box)
-        gradient = QLinearGradient(0, 0, 0, 1)
-        gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
-        gradient.setColorAt(0.0, QColor('#141A26'))
-        gradient.setColorAt(1.0, QColor('#101520'))
-        pane_plot.setBackground(QBrush(gradient))
+        pane_plot.setBackground(_PLOT_BACKGROUND_BRUSH)
         pane_plot.showGrid(x=True, y=True, alpha=0.2)
         pane_plot.setClipToView(True)
         pane_plot.setStyleSheet("border: 0px;")
@@ -1598,10 +2107,9 @@ class ChartView(QWidget):
         self._indicator_renderers[pane_id] = IndicatorRenderer(pane_plot.getPlotItem())
 
     def _apply_axis_style_to_plot(self, plot_widget: pg.PlotWidget) -> None:
-        axis_pen = pg.mkPen(theme.GRID)
-        text_pen = pg.mkPen(theme.TEXT)
-        font = QFont()
-        font.setPointSize(8)
+        axis_pen = self._axis_pen
+        text_pen = self._axis_text_pen
+        font = self._axis_font
         for axis_name in ('left', 'bottom', 'right'):
             axis = plot_widget.getAxis(axis_name)
             axis.setPen(axis_pen)
@@ -1614,7 +2122,12 @@ class ChartView(QWidget):
             axis.setTickFont(font)
 
     def _current_pane_ids(self) -> List[str]:
-        return list(self._indicator_panes.keys())
+        pane_ids = list(self._indicator_panes.keys())
+        # Include panes deferred for hidden instances so they stay selectable.
+        for instance in self._indicator_instances:
+            if instance.pane_id not in self._indicator_panes and instance.pane_id not in pane_ids:
+                pane_ids.append(instance.pane_id)
+        return pane_ids
 
     def _add_indicator_instance(self, indicator_id: str) -> None:
         info = self._indicator_defs.get(indicator_id)
@@ -1627,22 +2140,25 @@ class ChartView(QWidget):
         params = self._merge_params(schema.get("inputs", {}), "")
         instance_id = uuid.uuid4().hex
         sort_index = len(self._indicator_instances)
-        instance = {
-            "instance_id": instance_id,
-            "indicator_id": indicator_id,
-            "name": schema.get("name", indicator_id),
-            "pane_id": pane_id,
-            "params": params,
-            "visible": True,
-            "sort_index": sort_index,
-            "schema": schema,
-            "info": info,
-            "last_output": None,
-        }
+        instance = IndicatorInstance(
+            instance_id=instance_id,
+            indicator_id=str(indicator_id),
+            name=str(schema.get("name", indicator_id)),
+            pane_id=pane_id,
+            params=params,
+            visible=True,
+            sort_index=sort_index,
+            schema=schema,
+            info=info,
+        )
+        instance.set_info(info)
         self._indicator_instances.append(instance)
+        self._indicator_visible_count += 1
+        self._indicator_by_id[instance_id] = instance
+        self._indicator_instances_rev += 1
         self._clear_indicator_cache(instance_id)
         self._persist_indicator_instance(instance)
-        self._update_indicator_panel()
+        self._schedule_indicator_panel_refresh()
         self._recompute_indicators(immediate=True, reason="params")
 
     def _select_indicator_instance(self, instance_id: str) -> None:
@@ -1652,28 +2168,36 @@ class ChartView(QWidget):
         instance = self._find_indicator_instance(instance_id)
         if instance is None:
             return
-        pane_id = instance.get("pane_id", "price")
-        renderer = self._indicator_renderers.get(pane_id)
+        renderer = self._indicator_renderers.get(instance.pane_id)
         if renderer:
             renderer.clear_namespace(instance_id)
-        self._indicator_instances = [inst for inst in self._indicator_instances if inst.get("instance_id") != instance_id]
+        self._indicator_instances = [inst for inst in self._indicator_instances if inst is not instance]
+        if instance.visible:
+            self._indicator_visible_count -= 1
+        self._indicator_by_id.pop(str(instance_id), None)
+        self._indicator_params_parse_cache.pop(str(instance_id), None)
+        self._indicator_persist_dirty.discard(str(instance_id))
+        self._indicator_instances_rev += 1
         self._clear_indicator_cache(instance_id)
         self.store.delete_indicator_instance(instance_id)
         self._cleanup_empty_panes()
-        self._update_indicator_panel()
+        self._schedule_indicator_panel_refresh()
 
     def _toggle_indicator_visibility(self, instance_id: str, visible: bool) -> None:
         instance = self._find_indicator_instance(instance_id)
         if instance is None:
             return
-        instance["visible"] = visible
+        if instance.visible != visible:
+            self._indicator_visible_count += 1 if visible else -1
+        instance.visible = visible
         self._persist_indicator_instance(instance)
-        if not visible:
-            pane_id = instance.get("pane_id", "price")
-            renderer = self._indicator_renderers.get(pane_id)
+        if visible:
+            self._ensure_indicator_pane(instance.pane_id)
+        else:
+            renderer = self._indicator_renderers.get(instance.pane_id)
             if renderer:
                 renderer.clear_namespace(instance_id)
-        self._update_indicator_panel()
+        self._schedule_indicator_panel_refresh()
         if visible:
             self._recompute_indicators(immediate=True, reason="params")
 
@@ -1681,7 +2205,7 @@ class ChartView(QWidget):
         instance = self._find_indicator_instance(instance_id)
         if instance is None:
             return
-        instance["params"] = params
+        instance.params = params
         self._clear_indicator_cache(instance_id)
         self._persist_indicator_instance(instance)
         self._recompute_indicators(immediate=True, reason="params")
@@ -1690,57 +2214,77 @@ class ChartView(QWidget):
         instance = self._find_indicator_instance(instance_id)
         if instance is None:
             return
-        old_pane = instance.get("pane_id", "price")
+        old_pane = instance.pane_id
         if pane_id == old_pane:
             return
-        self._ensure_indicator_pane(pane_id)
-        instance["pane_id"] = pane_id
+        if instance.visible:
+            self._ensure_indicator_pane(pane_id)
+        else:
+            self._reserve_pane_id(pane_id)
+        instance.pane_id = pane_id
         self._clear_indicator_cache(instance_id)
         self._persist_indicator_instance(instance)
         renderer = self._indicator_renderers.get(old_pane)
         if renderer:
             renderer.clear_namespace(instance_id)
         self._cleanup_empty_panes()
-        self._update_indicator_panel()
+        self._schedule_indicator_panel_refresh()
         self._recompute_indicators(immediate=True, reason="params")
 
     def _reset_indicator_defaults(self, instance_id: str) -> None:
         instance = self._find_indicator_instance(instance_id)
         if instance is None:
             return
-        schema = instance.get("schema") or {}
+        schema = instance.schema or {}
         params = self._merge_params(schema.get("inputs", {}), "")
-        instance["params"] = params
+        instance.params = params
         self._clear_indicator_cache(instance_id)
         self._persist_indicator_instance(instance)
-        self._update_indicator_panel()
+        self._schedule_indicator_panel_refresh()
         self._recompute_indicators(immediate=True, reason="params")
 
-    def _find_indicator_instance(self, instance_id: str) -> Optional[Dict[str, object]]:
-        for instance in self._indicator_instances:
-            if instance.get("instance_id") == instance_id:
-                return instance
-        return None
+    def _find_indicator_instance(self, instance_id: str) -> Optional[IndicatorInstance]:
+        return self._indicator_by_id.get(str(instance_id))
 
     def _clear_indicator_cache(self, instance_id: str) -> None:
         self._indicator_cache.pop(instance_id, None)
 
-    def _persist_indicator_instance(self, instance: Dict[str, object]) -> None:
+    def _persist_indicator_instance(self, instance: IndicatorInstance) -> None:
+        self._indicator_panel_dirty_ids.add(instance.instance_id)
+        self._indicator_persist_dirty.add(instance.instance_id)
+        if not self._indicator_persist_timer.isActive():
+            self._indicator_persist_timer.start()
+
+    def _flush_indicator_persist(self) -> None:
+        self._indicator_persist_timer.stop()
+        dirty = self._indicator_persist_dirty
+        if not dirty:
+            return
+        self._indicator_persist_dirty = set()
+        rows = []
         try:
-            params_json = json.dumps(instance.get("params", {}))
-            self.store.upsert_indicator_instance(
-                instance_id=str(instance.get("instance_id")),
-                indicator_id=str(instance.get("indicator_id")),
-                pane_id=str(instance.get("pane_id")),
-                params_json=params_json,
-                visible=bool(instance.get("visible", True)),
-                sort_index=int(instance.get("sort_index", 0)),
-            )
+            for instance_id in dirty:
+                instance = self._indicator_by_id.get(instance_id)
+                if instance is None:
+                    continue
+                params = instance.params
+                params_json = _json_dumps(params)
+                rows.append(
+                    (
+                        instance_id,
+                        instance.indicator_id,
+                        instance.pane_id,
+                        params_json,
+                        instance.visible,
+                        instance.sort_index,
+                    )
+                )
+            self.store.upsert_indicator_instances(rows)
         except Exception as exc:
             self._report_error(f'Indicator persistence failed: {exc}')
 
     def _cleanup_empty_panes(self) -> None:
-        used_panes = {inst.get("pane_id", "price") for inst in self._indicator_instances}
+        used_panes = {inst.pane_id for inst in self._indicator_instances}
         for pane_id in list(self._indicator_panes.keys()):
             if pane_id == "price":
                 continue
@@ -1756,124 +2300,168 @@ class ChartView(QWidget):
                     except Exception:
                         pass
 
-    def _recompute_indicators(self, immediate: bool = True, reason: str = "view") -> None:
+    @staticmethod
+    def _merge_recompute_reason(current: Optional[str], reason: str) -> str:
+        if current is None:
+            return reason
+        if _RECOMPUTE_REASON_PRIORITY.get(reason, 0) > _RECOMPUTE_REASON_PRIORITY.get(current, 0):
+            return reason
+        return current
+
+    @staticmethod
+    def _merge_recompute_targets(current: Optional[set[str]], instance_ids: Optional[set[str]]) -> Optional[set[str]]:
+        # None means every instance, so it absorbs any targeted set.
+        if current is None or instance_ids is None:
+            return None
+        return current | set(instance_ids)
+
+    def _recompute_indicators(self, immediate: bool = True, reason: str = "view", instance_ids: Optional[set[str]] = None) -> None:
+        if self._indicator_visible_count == 0:
+            return
         if reason == "live" and self._last_visible_bars >= self._indicator_freeze_visible_bars:
             return
         if self._indicator_recompute_pending:
+            # Fold bursts (hot reload, param edits, pans) into the pending pass with the strongest reason.
+            self._indicator_recompute_only = self._merge_recompute_targets(self._indicator_recompute_only, instance_ids)
+            self._indicator_recompute_reason = self._merge_recompute_reason(self._indicator_recompute_reason, reason)
+            if immediate and not self._indicator_coalesce_timer.isActive():
+                self._indicator_recompute_timer.stop()
+                self._indicator_coalesce_timer.start()
             return
         self._indicator_recompute_pending = True
+        self._indicator_recompute_only = set(instance_ids) if instance_ids is not None else None
         self._indicator_recompute_reason = reason
         if reason == "view" and self._last_visible_bars >= self._indicator_freeze_visible_bars and not immediate:
             return
         if immediate:
             self._indicator_recompute_timer.stop()
-            QTimer.singleShot(0, self._do_recompute_indicators)
+            self._indicator_coalesce_timer.start()
         else:
             self._indicator_recompute_timer.start(self._indicator_recompute_debounce_ms)
 
     def _do_recompute_indicators(self, force: bool = False) -> None:
         self._indicator_recompute_pending = False
+        self._indicator_coalesce_timer.stop()
+        only_ids = None if force else self._indicator_recompute_only
+        self._indicator_recompute_only = None
         if self._initial_load_pending:
             return
-        bars = getattr(self.candles, "candles", [])
+        bars = self.candles.candles
         if not bars:
             return
-        bars_key = None
-        try:
-            bars_key = (len(bars), float(bars[0][0]), float(bars[-1][0]))
-        except Exception:
-            bars_key = None
+        ohlcv = self.candles.get_ohlcv_array()
+        if ohlcv.shape[1] == len(bars):
+            bars_key = self.candles.get_bars_key()
+        else:
+            ohlcv = None
+            try:
+                bars_key = (len(bars), float(bars[0][0]), float(bars[-1][0]))
+            except Exception:
+                bars_key = None
         view_start_idx, view_end_idx = self.candles.get_view_index_range(margin=10)
         view_idx_key = (view_start_idx, view_end_idx)
-        reason = getattr(self, "_indicator_recompute_reason", "view")
+        reason = self._indicator_recompute_reason
         if reason == "view" and view_idx_key == self._last_indicator_view_idx_key and not force:
             return
         self._last_indicator_view_idx_key = view_idx_key
         view_key = None
         view_bars = bars
+        view_times: Optional[np.ndarray] = ohlcv[0] if ohlcv is not None else None
         if view_start_idx is not None and view_end_idx is not None:
             view_bars = bars[view_start_idx:view_end_idx]
-            if view_bars:
+            if view_times is not None:
+                view_times = view_times[view_start_idx:view_end_idx]
+            if view_times is not None and view_times.size:
+                view_key = (int(view_times.size), float(view_times[0]), float(view_times[-1]))
+            elif view_bars:
                 try:
                     view_key = (len(view_bars), float(view_bars[0][0]), float(view_bars[-1][0]))
                 except Exception:
                     view_key = None
+        # Hoist attribute lookups out of the per-instance loop.
+        renderers = self._indicator_renderers
+        last_outputs = self._indicator_last_output
+        ensure_cache = self._ensure_indicator_cache
+        is_range_cached = self._is_range_cached
+        bars_len = len(bars)
+        max_compute_bars = self._indicator_max_compute_bars
+        # Resolved once per pass and shared by every cache-hit render below.
+        cached_times: Optional[np.ndarray] = None
         tasks = []
         for instance in self._indicator_instances:
-            if not instance.get("visible", True):
+            compute_fn = instance.compute_fn
+            if not instance.visible or compute_fn is None:
                 continue
-            info = instance.get("info")
-            if info is None:
-                continue
-            compute_fn = getattr(info.module, "compute", None)
-            if compute_fn is None:
+            instance_id = instance.instance_id
+            if only_ids is not None and instance_id not in only_ids:
                 continue
-            instance_id = str(instance.get("instance_id"))
-            params = instance.get("params", {})
-            required = int(instance.get("required_lookback", 0) or 0)
+            if instance.pane_id not in renderers:
+                self._ensure_indicator_pane(instance.pane_id)
+            params = instance.params
+            required = instance.required_lookback
             if bars_key is not None:
-                cache = self._ensure_indicator_cache(instance_id, bars_key, len(bars))
+                cache = ensure_cache(instance_id, bars_key, bars_len)
                 if reason == "view" and view_start_idx is not None and view_end_idx is not None:
-                    if self._is_range_cached(cache["mask"], view_start_idx, view_end_idx) and not force:
-                        instance["last_view_key"] = view_key
-                        instance["last_view_idx_key"] = view_idx_key
-                        renderer = self._indicator_renderers.get(instance.get("pane_id", "price"))
+                    if is_range_cached(cache["mask"], view_start_idx, view_end_idx) and not force:
+                        instance.last_view_key = view_key
+                        instance.last_view_idx_key = view_idx_key
+                        renderer = renderers.get(instance.pane_id)
                         if renderer and view_bars:
                             try:
-                                times = np.asarray([float(b[0]) for b in view_bars], dtype=np.float64)
+                                if cached_times is None:
+                                    cached_times = self._indicator_view_times(view_key, view_bars, view_times)
+                                times = cached_times
                                 cached_output = self._build_output_from_cache(cache, view_start_idx, view_end_idx)
                                 if cached_output:
-                                    self._indicator_last_output[instance_id] = cached_output
-                                    renderer.render((view_bars, times), cached_output, namespace=str(instance.get("instance_id")))
+                                    last_outputs[instance_id] = cached_output
+                                    renderer.render((view_bars, times), cached_output, namespace=instance_id)
                             except Exception:
                                 pass
                         continue
             if view_start_idx is None or view_end_idx is None:
-                slice_bars = bars
                 render_bars = bars
                 compute_start_idx = 0
-                compute_end_idx = len(bars)
+                compute_end_idx = bars_len
             else:
-                start_idx = max(0, view_start_idx - required)
-                end_idx = max(start_idx, view_end_idx)
-                slice_bars = bars[start_idx:end_idx]
                 render_bars = view_bars
-                compute_start_idx = start_idx
-                compute_end_idx = end_idx
+                compute_start_idx = max(0, view_start_idx - required)
+                compute_end_idx = max(compute_start_idx, view_end_idx)
             merge = False
             tail_len = 0
-            last_view_key = instance.get("last_view_key")
+            last_view_key = instance.last_view_key
             view_changed = view_key is not None and last_view_key != view_key
-            if reason == "view" and instance.get("last_view_idx_key") == view_idx_key and not force:
+            if reason == "view" and instance.last_view_idx_key == view_idx_key and not force:
                 continue
             if reason == "live" and last_view_key == view_key:
-                prev_output = self._indicator_last_output.get(instance_id)
+                prev_output = last_outputs.get(instance_id)
                 if prev_output:
                     tail_len = min(len(render_bars), max(required + 2, 20)) if render_bars else 0
                     if tail_len > 0:
-                        slice_bars = render_bars[-tail_len:]
                         merge = True
-                        if view_end_idx is not None:
-                            compute_end_idx = view_end_idx
-                            compute_start_idx = max(0, compute_end_idx - len(slice_bars))
-            max_compute = max(self._indicator_max_compute_bars, required + 2)
-            if (reason != "view" and not view_changed) and len(slice_bars) > max_compute:
-                orig_end = compute_end_idx
-                slice_bars = slice_bars[-max_compute:]
-                compute_end_idx = orig_end
-                compute_start_idx = max(0, compute_end_idx - len(slice_bars))
+                        compute_end_idx = view_end_idx if view_end_idx is not None else bars_len
+                        compute_start_idx = max(0, compute_end_idx - tail_len)
+            max_compute = max(max_compute_bars, required + 2)
+            if (reason != "view" and not view_changed) and compute_end_idx - compute_start_idx > max_compute:
+                compute_start_idx = compute_end_idx - max_compute
+            if ohlcv is not None:
+                # Snapshot the columns so live ticks can't race the worker; rows of .T are (t, o, h, l, c, v).
+                compute_bars = ohlcv[:, compute_start_idx:compute_end_idx].copy().T
+            else:
+                compute_bars = bars[compute_start_idx:compute_end_idx]
             tasks.append({
                 "instance_id": instance_id,
                 "compute_fn": compute_fn,
                 "params": params,
-                "compute_bars": slice_bars,
+                "compute_bars": compute_bars,
                 "render_bars": render_bars,
-                "pane_id": instance.get("pane_id", "price"),
+                "render_times": view_times,
+                "pane_id": instance.pane_id,
                 "view_key": view_key,
                 "view_idx_key": view_idx_key,
                 "merge": merge,
                 "tail_len": tail_len,
                 "bars_key": bars_key,
+                "bars_len": bars_len,
                 "compute_start_idx": compute_start_idx,
                 "compute_end_idx": compute_end_idx,
             })
@@ -1881,7 +2469,14 @@ class ChartView(QWidget):
         if not tasks:
             return
         if self._indicator_compute_worker and self._indicator_compute_worker.isRunning():
+            # Replay this pass once the worker finishes; forget the view key so it isn't skipped.
+            if self._indicator_compute_pending:
+                only_ids = self._merge_recompute_targets(self._indicator_compute_pending_only, only_ids)
+                reason = self._merge_recompute_reason(self._indicator_compute_pending_reason, reason)
+            self._indicator_compute_pending_only = only_ids
+            self._indicator_compute_pending_reason = reason
             self._indicator_compute_pending = True
+            self._last_indicator_view_idx_key = None
             return
         self._start_indicator_compute_worker(tasks, reason=reason)
 
@@ -1897,7 +2492,8 @@ class ChartView(QWidget):
         self._symbol_worker.start()
 
     def _on_symbols_ready(self, symbols: List[str]) -> None:
-        if symbols:
+        if symbols and symbols != self._symbol_items:
+            self._symbol_items = list(symbols)
             self.symbol_box.blockSignals(True)
             self.symbol_box.clear()
             self.symbol_box.addItems(symbols)
@@ -1919,6 +2515,9 @@ class ChartView(QWidget):
         self._set_loading(False, '')
 
     def _setup_symbol_search(self) -> None:
+        # The proxy tracks the combo's model, so later symbol reloads reuse it and the completer.
+        if self._symbol_filter is not None:
+            return
         model = self.symbol_box.model()
         if model is None:
             return
@@ -1935,13 +2534,25 @@ class ChartView(QWidget):
         popup = completer.popup()
         popup.setObjectName('SymbolCompleterPopup')
         self.symbol_box.setCompleter(completer)
-        self.symbol_box.lineEdit().textEdited.connect(proxy.setFilterFixedString)
+        self.symbol_box.lineEdit().textEdited.connect(self._queue_symbol_filter)
+
+    def _queue_symbol_filter(self, text: str) -> None:
+        self._pending_symbol_filter = text
+        self._symbol_filter_timer.start()
+
+    def _apply_symbol_filter(self) -> None:
+        if self._symbol_filter is not None:
+            self._symbol_filter.setFilterFixedString(self._pending_symbol_filter)
 
     def _load_initial_data(self, use_cache_only: bool = False) -> None:
+        # Loads read the cache, so land any buffered live bars first.
+        self._flush_store_bars()
         symbol = self.symbol_box.currentText() or 'BTCUSDT'
         timeframe = self.current_timeframe
+        self._active_symbol = symbol
+        self._active_timeframe = timeframe
         bar_count = 500
-        self.candles.set_timeframe(timeframe)
+        self._set_candle_timeframe(timeframe)
         mode = 'load_cached' if use_cache_only else 'load'
         cached_range = self.store.get_cached_range(self.exchange, symbol, timeframe)
         self._stop_live_stream()
@@ -2006,6 +2617,7 @@ class ChartView(QWidget):
     def _clear_tab_bar(self) -> None:
         while self.tab_bar.count() > 0:
             self.tab_bar.removeTab(0)
+        self._plus_index = -1
 
     def _set_active_tab(self, index: int) -> None:
         if self.tab_bar.count() == 0:
@@ -2040,6 +2652,10 @@ class ChartView(QWidget):
         self._persist_tabs()
 
     def _persist_tabs(self) -> None:
+        self._persist_debounce_timer.start()
+
+    def _do_persist_tabs(self) -> None:
+        self._persist_debounce_timer.stop()
         entries = []
         for i in range(self.tab_bar.count() - 1):
             symbol = self.tab_bar.tabText(i)
@@ -2072,6 +2688,7 @@ class ChartView(QWidget):
         if self.tab_bar.count() <= 2:
             return
         self.tab_bar.removeTab(index)
+        self._plus_index = self.tab_bar.count() - 1
         if self.tab_bar.currentIndex() == self.tab_bar.count() - 1:
             self.tab_bar.setCurrentIndex(max(0, self.tab_bar.count() - 2))
         self._persist_tabs()
@@ -2097,12 +2714,14 @@ class ChartView(QWidget):
             if idx == keep_index:
                 continue
             self.tab_bar.removeTab(idx)
+        self._plus_index = self.tab_bar.count() - 1
         self.tab_bar.setCurrentIndex(min(keep_index, self.tab_bar.count() - 2))
         self._persist_tabs()
 
     def _close_all_tabs(self) -> None:
         while self.tab_bar.count() > 1:
             self.tab_bar.removeTab(0)
+        self._plus_index = self.tab_bar.count() - 1
         self.tab_bar.setCurrentIndex(0)
         self._persist_tabs()
 
@@ -2118,41 +2737,68 @@ class ChartView(QWidget):
 
     def _on_tab_moved(self, from_index: int, to_index: int) -> None:
         plus_index = self.tab_bar.count() - 1
+        plus_pos = self._shifted_tab_index(self._plus_index, from_index, to_index)
         moved_plus = self.tab_bar.tabText(to_index) == '+'
         if moved_plus or from_index == plus_index or to_index == plus_index:
+            self._apply_plus_reorder(from_index, to_index, plus_pos, moved_plus)
+            self._skip_next_plus = True
+        else:
+            self._plus_index = plus_pos
+        self._persist_tabs()
+
+    def _apply_plus_reorder(self, from_index: int, to_index: int, plus_pos: int, moved_plus: bool) -> None:
+        # One signal-blocked, non-repainting pass that puts the '+' tab back at the end.
+        tab_bar = self.tab_bar
+        plus_index = tab_bar.count() - 1
+        tab_bar.setUpdatesEnabled(False)
+        tab_bar.blockSignals(True)
+        try:
             if moved_plus:
-                symbol = self.tab_bar.tabText(to_index)
-                tf = self._get_tab_timeframe(to_index) or self.current_timeframe
                 prev_last = plus_index if plus_index != to_index else from_index
-                if prev_last >= 0 and prev_last < self.tab_bar.count():
-                    prev_symbol = self.tab_bar.tabText(prev_last)
+                if 0 <= prev_last < tab_bar.count():
+                    prev_symbol = tab_bar.tabText(prev_last)
                     prev_tf = self._get_tab_timeframe(prev_last) or self.current_timeframe
-                    self.tab_bar.blockSignals(True)
-                    self.tab_bar.setTabText(to_index, prev_symbol)
-                    self.tab_bar.setTabData(to_index, prev_tf)
-                    self.tab_bar.setTabText(prev_last, '+')
-                    self.tab_bar.setTabData(prev_last, None)
-                    self.tab_bar.blockSignals(False)
-            if self.tab_bar.tabText(self.tab_bar.count() - 1) != '+':
-                plus_pos = None
-                for idx in range(self.tab_bar.count()):
-                    if self.tab_bar.tabText(idx) == '+':
-                        plus_pos = idx
-                        break
-                if plus_pos is not None:
-                    self.tab_bar.blockSignals(True)
-                    self.tab_bar.moveTab(plus_pos, self.tab_bar.count() - 1)
-                    self.tab_bar.blockSignals(False)
-            self._ensure_plus_tab(self.tab_bar.count() - 1)
-            self._skip_next_plus = True
-        self._persist_tabs()
+                    tab_bar.setTabText(to_index, prev_symbol)
+                    tab_bar.setTabData(to_index, prev_tf)
+                    tab_bar.setTabText(prev_last, '+')
+                    tab_bar.setTabData(prev_last, None)
+                    plus_pos = prev_last
+            if tab_bar.tabText(plus_index) != '+':
+                if not (0 <= plus_pos < tab_bar.count() and tab_bar.tabText(plus_pos) == '+'):
+                    # Tracking drifted (a tab bar change we didn't observe); fall back to a scan.
+                    plus_pos = next(
+                        (idx for idx in range(tab_bar.count()) if tab_bar.tabText(idx) == '+'),
+                        -1,
+                    )
+                if plus_pos >= 0:
+                    tab_bar.moveTab(plus_pos, plus_index)
+            self._ensure_plus_tab(plus_index)
+        finally:
+            tab_bar.blockSignals(False)
+            tab_bar.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _shifted_tab_index(index: int, from_index: int, to_index: int) -> int:
+        # Where a tab at `index` ends up after QTabBar moves from_index -> to_index.
+        if index == from_index:
+            return to_index
+        if from_index < index <= to_index:
+            return index - 1
+        if to_index <= index < from_index:
+            return index + 1
+        return index
 
     def _ensure_plus_tab(self, index: int) -> None:
         if index < 0 or index >= self.tab_bar.count():
             return
-        self.tab_bar.setTabText(index, '+')
-        self.tab_bar.setTabData(index, None)
-        self.tab_bar.setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+        # Each setter relayouts the bar even for an identical value, so skip a tab that is already the plus tab.
+        if self.tab_bar.tabText(index) != '+':
+            self.tab_bar.setTabText(index, '+')
+        if self.tab_bar.tabData(index) is not None:
+            self.tab_bar.setTabData(index, None)
+        if self.tab_bar.tabButton(index, QTabBar.ButtonPosition.RightSide) is not None:
+            self.tab_bar.setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+        self._plus_index = index
 
     def _parse_tab_entry(self, entry: str) -> tuple[str, str]:
         if '|' not in entry:
@@ -2194,8 +2840,9 @@ class ChartView(QWidget):
     ) -> None:
         if self._worker and self._worker.isRunning():
             return
+        self._flush_store_bars()
         self._last_fetch_mode = mode
-        self._fetch_start_ms = int(time.time() * 1000)
+        self._fetch_start_ms = _monotonic_ms()
         self._set_loading(True, f'Loading {symbol} {timeframe}...')
         self._worker = DataFetchWorker(
             mode,
@@ -2213,6 +2860,7 @@ class ChartView(QWidget):
         self._worker.error.connect(self._on_error)
         self._worker.finished.connect(self._on_fetch_finished)
         self._worker.start()
+        self._fetch_running = True
 
     def _on_data_ready(self, bars: list) -> None:
         if bars:
@@ -2230,9 +2878,10 @@ class ChartView(QWidget):
         self._emit_debug_state()
 
     def _on_fetch_finished(self) -> None:
+        self._fetch_running = False
         self._set_loading(False, '')
         if self._fetch_start_ms is not None:
-            self._last_fetch_duration_ms = int(time.time() * 1000) - self._fetch_start_ms
+            self._last_fetch_duration_ms = _monotonic_ms() - self._fetch_start_ms
             self._fetch_start_ms = None
         self._emit_debug_state()
 
@@ -2261,8 +2910,12 @@ class ChartView(QWidget):
         key = (symbol, timeframe)
         if key in self._history_probe_inflight:
             return
-        if key in self._history_probe_queue:
+        cached = self._history_probe_cache.get(key)
+        if cached is not None and _monotonic_ms() - cached[0] < self._history_probe_ttl_ms:
             return
+        if key in self._history_probe_queued:
+            return
+        self._history_probe_queued.add(key)
         self._history_probe_queue.append(key)
 
     def _start_history_probe(self) -> None:
@@ -2272,23 +2925,23 @@ class ChartView(QWidget):
         self._start_next_history_probe()
 
     def _start_next_history_probe(self) -> None:
-        if self._history_probe_worker and self._history_probe_worker.isRunning():
-            return
-        if not self._history_probe_queue:
-            return
-        symbol, timeframe = self._history_probe_queue.pop(0)
-        key = (symbol, timeframe)
-        if key in self._history_probe_inflight:
-            return
-        self._history_probe_inflight.add(key)
-        self._report_error(f'[history] Probing earliest {symbol} {timeframe}...')
-        self._history_probe_worker = HistoryProbeWorker(self.store, self.exchange, symbol, timeframe)
-        self._history_probe_worker.result.connect(self._on_history_probe_result)
-        self._history_probe_worker.error.connect(self._on_history_probe_error)
-        self._history_probe_worker.finished.connect(self._on_history_probe_finished)
-        self._history_probe_worker.start()
+        while self._history_probe_queue and len(self._history_probe_workers) < self._history_probe_max_workers:
+            key = self._history_probe_queue.popleft()
+            self._history_probe_queued.discard(key)
+            if key in self._history_probe_inflight:
+                continue
+            symbol, timeframe = key
+            self._history_probe_inflight.add(key)
+            self._report_error(f'[history] Probing earliest {symbol} {timeframe}...')
+            worker = HistoryProbeWorker(self.store, self.exchange, symbol, timeframe)
+            worker.result.connect(self._on_history_probe_result)
+            worker.error.connect(self._on_history_probe_error)
+            worker.finished.connect(self._on_history_probe_finished)
+            self._history_probe_workers[key] = worker
+            worker.start()
 
     def _on_history_probe_result(self, symbol: str, timeframe: str, earliest) -> None:
+        self._history_probe_cache[(symbol, timeframe)] = (_monotonic_ms(), earliest)
         if earliest is None:
             self._report_error(f'[history] No earliest candle found for {symbol} {timeframe}.')
         else:
@@ -2303,9 +2956,12 @@ class ChartView(QWidget):
         self._report_error(f'[history] Probe failed: {message}')
 
     def _on_history_probe_finished(self) -> None:
-        worker = self._history_probe_worker
-        if worker is not None:
-            self._history_probe_inflight.discard((worker.symbol, worker.timeframe))
+        worker = self.sender()
+        if isinstance(worker, HistoryProbeWorker):
+            key = (worker.symbol, worker.timeframe)
+            if self._history_probe_workers.get(key) is worker:
+                del self._history_probe_workers[key]
+            self._history_probe_inflight.discard(key)
         self._start_next_history_probe()
 
     def _start_candle_normalize(self, bars: list, auto_range: bool) -> None:
@@ -2314,43 +2970,66 @@ class ChartView(QWidget):
             return
         if bars:
             try:
-                existing = getattr(self.candles, "candles", [])
+                existing = self.candles.candles
             except Exception:
                 existing = []
             if existing:
                 try:
-                    bars_start = float(bars[0][0])
-                    bars_end = float(bars[-1][0])
-                    existing_start = float(existing[0][0])
-                    existing_end = float(existing[-1][0])
+                    # Fetch and store layers hand back numeric rows; no float() re-parse needed.
+                    bars_start = bars[0][0]
+                    bars_end = bars[-1][0]
+                    existing_start, existing_end = self.candles.get_time_range()
                 except Exception:
+                    existing_start = None
+                if existing_start is None or existing_end is None:
                     bars_start = bars_end = existing_start = existing_end = None
                 if bars_start is not None:
                     ts_cache = getattr(self.candles, "_ts_cache", [])
                     if ts_cache and bars_start >= existing_start and bars_end <= existing_end:
+                        window_cols: Optional[np.ndarray] = None
                         try:
-                            start_idx = bisect_left(ts_cache, bars_start)
-                            end_idx = bisect_right(ts_cache, bars_end)
-                            normalized = existing[start_idx:end_idx]
+                            ts_arr = self.candles.get_ts_array()
+                            if ts_arr.size == len(existing):
+                                start_idx = int(np.searchsorted(ts_arr, bars_start, side='left'))
+                                end_idx = int(np.searchsorted(ts_arr, bars_end, side='right'))
+                                # The column buffer is in sync, so the slice's columns come along too.
+                                window_cols = self.candles.get_ohlcv_array()[:, start_idx:end_idx]
+                            else:
+                                start_idx = bisect_left(ts_cache, bars_start)
+                                end_idx = bisect_right(ts_cache, bars_end)
+                            if start_idx == 0 and end_idx == len(existing):
+                                # Same window as the chart already holds; hand it back without copying.
+                                normalized = existing
+                            else:
+                                normalized = existing[start_idx:end_idx]
                         except Exception:
                             normalized = None
+                            window_cols = None
                         if normalized:
                             self._ignore_view_range = True
                             self._candle_normalize_seq += 1
                             seq = self._candle_normalize_seq
                             self._candle_normalize_last_ms = 0
-                            self._on_candle_normalized(seq, normalized, [], int(auto_range))
+                            self._on_candle_normalized(seq, normalized, int(auto_range), ohlcv=window_cols)
                             return
                     if bars_start <= existing_start and bars_end >= existing_end:
                         prefix = []
                         suffix = []
                         try:
-                            for row in bars:
-                                ts = float(row[0])
-                                if ts < existing_start:
-                                    prefix.append(row)
-                                elif ts > existing_end:
-                                    suffix.append(row)
+                            ts_col = np.fromiter((row[0] for row in bars), dtype=np.float64, count=len(bars))
+                            if ts_col.size < 2 or bool(np.all(ts_col[1:] >= ts_col[:-1])):
+                                # Fetched bars are time-ordered, so the split points are two binary searches.
+                                cut_left = int(np.searchsorted(ts_col, existing_start, side='left'))
+                                cut_right = int(np.searchsorted(ts_col, existing_end, side='right'))
+                                prefix = bars[:cut_left]
+                                suffix = bars[cut_right:]
+                            else:
+                                for row in bars:
+                                    ts = float(row[0])
+                                    if ts < existing_start:
+                                        prefix.append(row)
+                                    elif ts > existing_end:
+                                        suffix.append(row)
                         except Exception:
                             prefix = []
                             suffix = []
@@ -2358,7 +3037,7 @@ class ChartView(QWidget):
                             self._ignore_view_range = True
                             self._candle_normalize_seq += 1
                             seq = self._candle_normalize_seq
-                            self._candle_normalize_last_start = time.time()
+                            self._candle_normalize_last_start = _monotonic_ms()
                             self._candle_normalize_merge[seq] = {
                                 "prefix_len": len(prefix),
                                 "suffix_len": len(suffix),
@@ -2376,7 +3055,7 @@ class ChartView(QWidget):
         self._ignore_view_range = True
         self._candle_normalize_seq += 1
         seq = self._candle_normalize_seq
-        self._candle_normalize_last_start = time.time()
+        self._candle_normalize_last_start = _monotonic_ms()
         worker = CandleNormalizeWorker(bars, auto_range, seq)
         self._candle_normalize_worker = worker
         worker.result.connect(self._on_candle_normalized)
@@ -2384,15 +3063,22 @@ class ChartView(QWidget):
         worker.finished.connect(self._on_candle_normalize_finished)
         worker.start()
 
-    def _on_candle_normalized(self, seq: int, normalized: list, ts_cache: list, auto_range_flag: int) -> None:
+    def _on_candle_normalized(
+        self,
+        seq: int,
+        normalized: list,
+        auto_range_flag: int,
+        ohlcv: Optional[np.ndarray] = None,
+    ) -> None:
         if seq != self._candle_normalize_seq:
             return
         if hasattr(self, "_candle_normalize_last_start"):
-            self._candle_normalize_last_ms = int((time.time() - self._candle_normalize_last_start) * 1000)
+            self._candle_normalize_last_ms = _monotonic_ms() - self._candle_normalize_last_start
             self._candle_normalize_last_ts = time.time()
             self._perf_note("candle_normalize", self._candle_normalize_last_ms)
         try:
             auto_range = bool(auto_range_flag)
+            merged_cols: Optional[np.ndarray] = ohlcv
             merge_info = self._candle_normalize_merge.pop(seq, None)
             if merge_info:
                 prefix_len = int(merge_info.get("prefix_len", 0))
@@ -2400,9 +3086,19 @@ class ChartView(QWidget):
                 existing = merge_info.get("existing") or []
                 prefix = normalized[:prefix_len] if prefix_len > 0 else []
                 suffix = normalized[prefix_len:prefix_len + suffix_len] if suffix_len > 0 else []
-                normalized = prefix + existing + suffix
+                existing_cols = self.candles.get_ohlcv_array()
+                normalized = [*prefix, *existing, *suffix]
+                if existing is self.candles.candles and existing_cols.shape[1] == len(existing):
+                    # Extend the chart's column buffer instead of re-boxing every merged row.
+                    try:
+                        merged_cols = np.concatenate(
+                            [self._ohlcv_columns(prefix), existing_cols, self._ohlcv_columns(suffix)],
+                            axis=1,
+                        )
+                    except (ValueError, TypeError):
+                        merged_cols = None
             self.candles.begin_bulk_update()
-            self.candles.set_historical_data(normalized, auto_range=False, normalized=True)
+            self.candles.set_historical_data(normalized, auto_range=False, normalized=True, ohlcv=merged_cols)
             self.candles.end_bulk_update(auto_range=auto_range)
             try:
                 self._window_start_ms = int(normalized[0][0]) if normalized else None
@@ -2430,6 +3126,12 @@ class ChartView(QWidget):
         if self._last_fetch_mode in ('load', 'load_cached'):
             self._start_history_probe()
 
+    @staticmethod
+    def _ohlcv_columns(rows: list) -> np.ndarray:
+        if not rows:
+            return np.empty((6, 0), dtype=np.float64)
+        return np.asarray(rows, dtype=np.float64)[:, :6].T
+
     def _on_candle_normalize_error(self, message: str) -> None:
         self._ignore_view_range = False
         self._report_error(f'Chart render failed: {message}')
@@ -2443,20 +3145,42 @@ class ChartView(QWidget):
     def _start_live_stream(self) -> None:
         if os.environ.get("PYSUPERCHART_NO_LIVE") == "1":
             return
-        symbol = self.symbol_box.currentText() or 'BTCUSDT'
-        timeframe = self.current_timeframe
-        self.candles.set_timeframe(timeframe)
+        symbol = self._active_symbol
+        timeframe = self._active_timeframe
+        self._set_candle_timeframe(timeframe)
         self._stop_live_stream()
         self._kline_worker = LiveKlineWorker(symbol, timeframe)
         self._kline_worker.kline.connect(self._on_kline)
-        self._kline_worker.error.connect(lambda msg: self._report_error(f'Live stream error: {msg}'))
+        self._kline_worker.error.connect(self._on_kline_stream_error)
+        self._kline_worker.finished.connect(self._on_kline_worker_finished)
         self._kline_worker.start()
-        self._trade_worker = LiveTradeWorker(symbol)
-        self._trade_worker.trade.connect(self._on_trade)
-        self._trade_worker.error.connect(lambda msg: self._report_error(f'Trade stream error: {msg}'))
+        self._kline_running = True
+        self._trade_worker = LiveTradeWorker(symbol, self._tf_ms)
+        self._trade_worker.error.connect(self._on_trade_stream_error)
+        self._trade_worker.finished.connect(self._on_trade_worker_finished)
         self._trade_worker.start()
+        self._trade_running = True
+        self._trade_drain_timer.start()
+
+    def _on_kline_stream_error(self, message: str) -> None:
+        self._report_error(f'Live stream error: {message}')
+
+    def _on_trade_stream_error(self, message: str) -> None:
+        self._report_error(f'Trade stream error: {message}')
+
+    def _on_kline_worker_finished(self) -> None:
+        # A stopped stream's finished can arrive after its replacement started.
+        if self.sender() is self._kline_worker:
+            self._kline_running = False
+
+    def _on_trade_worker_finished(self) -> None:
+        if self.sender() is self._trade_worker:
+            self._trade_running = False
 
     def _stop_live_stream(self) -> None:
+        self._kline_running = False
+        self._trade_running = False
+        self._trade_drain_timer.stop()
         if self._kline_worker is not None:
             self._kline_worker.stop()
             self._kline_worker.wait(500)
@@ -2467,12 +3191,22 @@ class ChartView(QWidget):
             self._trade_worker = None
 
     def shutdown(self) -> None:
+        self._flush_indicator_persist()
+        self._flush_store_bars()
+        if self._persist_debounce_timer.isActive():
+            self._do_persist_tabs()
         if self._worker and self._worker.isRunning():
             self._worker.quit()
             self._worker.wait(1500)
         if self._symbol_worker and self._symbol_worker.isRunning():
             self._symbol_worker.quit()
             self._symbol_worker.wait(1500)
+        if self._cache_state_worker is not None:
+            self._cache_state_worker.wait(1500)
+        if self._indicator_warmup_thread is not None:
+            # A numba compile can't be interrupted; past the timeout it is left to die with the process.
+            self._indicator_warmup_thread.join(1.5)
+            self._indicator_warmup_thread = None
         if self._indicator_hot_reload is not None:
             try:
                 self._indicator_hot_reload.stop()
@@ -2505,6 +3239,9 @@ class ChartView(QWidget):
                 self._strategy_store.close()
             except Exception:
                 pass
+        if self._schema_pool is not None:
+            self._schema_pool.shutdown(wait=False, cancel_futures=True)
+            self._schema_pool = None
 
     def export_chart_png(self, path: str) -> None:
         pixmap = self.plot_widget.grab()
@@ -2515,36 +3252,62 @@ class ChartView(QWidget):
             self._pending_kline = kline
             return
         try:
-            self.candles.update_live_kline(kline)
+            self._update_live_kline(kline)
         except Exception as exc:
             self._report_error(f'Live candle update failed: {exc}')
             return
         if kline.get('closed'):
             try:
-                ts = int(kline.get('ts_ms', 0))
-                o = float(kline.get('open', 0))
-                h = float(kline.get('high', 0))
-                l = float(kline.get('low', 0))
-                c = float(kline.get('close', 0))
-                v = float(kline.get('volume', 0))
-                if ts > 0 and o > 0 and h > 0 and l > 0 and c > 0:
-                    symbol = self.symbol_box.currentText() or 'BTCUSDT'
-                    timeframe = self.current_timeframe
-                    self.store.store_bars(self.exchange, symbol, timeframe, [[ts, o, h, l, c, v]])
+                self._store_closed_kline(kline)
             except Exception as exc:
                 self._report_error(f'Cache update failed: {exc}')
+            # The close pass already covers the newest bar; restart the trade gate from here.
+            self._last_live_indicator_ms = _monotonic_ms()
             self._recompute_indicators(immediate=True, reason="close")
         self._emit_debug_state()
 
+    def _store_closed_kline(self, kline: dict) -> None:
+        # LiveKlineWorker already emits ints/floats, so no re-parsing on the GUI thread.
+        ts = kline.get('ts_ms', 0)
+        o = kline.get('open', 0.0)
+        h = kline.get('high', 0.0)
+        l = kline.get('low', 0.0)
+        c = kline.get('close', 0.0)
+        v = kline.get('volume', 0.0)
+        if ts > 0 and o > 0 and h > 0 and l > 0 and c > 0:
+            key = (self._active_symbol, self._active_timeframe)
+            self._pending_store_bars.setdefault(key, []).append([ts, o, h, l, c, v])
+            if not self._store_bars_timer.isActive():
+                self._store_bars_timer.start()
+
+    def _flush_store_bars(self) -> None:
+        self._store_bars_timer.stop()
+        if not self._pending_store_bars:
+            return
+        pending = self._pending_store_bars
+        self._pending_store_bars = {}
+        for (symbol, timeframe), rows in pending.items():
+            try:
+                self.store.store_bars(self.exchange, symbol, timeframe, rows)
+            except Exception as exc:
+                self._report_error(f'Cache update failed: {exc}')
+
+    def _drain_trades(self) -> None:
+        worker = self._trade_worker
+        if worker is None:
+            return
+        for trade in worker.take_pending():
+            self._on_trade(trade)
+
     def _on_trade(self, trade: dict) -> None:
         if self._initial_load_pending:
             self._pending_trade = trade
             return
         try:
-            self.candles.update_live_trade(trade)
+            self._update_live_trade(trade)
         except Exception as exc:
             self._report_error(f'Live trade update failed: {exc}')
-        now_ms = int(time.time() * 1000)
+        now_ms = _monotonic_ms()
         if now_ms - self._last_live_indicator_ms >= 250:
             self._last_live_indicator_ms = now_ms
             self._recompute_indicators(immediate=False, reason="live")
@@ -2555,25 +3318,16 @@ class ChartView(QWidget):
             kline = self._pending_kline
             self._pending_kline = None
             try:
-                self.candles.update_live_kline(kline)
+                self._update_live_kline(kline)
                 if kline.get('closed'):
-                    ts = int(kline.get('ts_ms', 0))
-                    o = float(kline.get('open', 0))
-                    h = float(kline.get('high', 0))
-                    l = float(kline.get('low', 0))
-                    c = float(kline.get('close', 0))
-                    v = float(kline.get('volume', 0))
-                    if ts > 0 and o > 0 and h > 0 and l > 0 and c > 0:
-                        symbol = self.symbol_box.currentText() or 'BTCUSDT'
-                        timeframe = self.current_timeframe
-                        self.store.store_bars(self.exchange, symbol, timeframe, [[ts, o, h, l, c, v]])
+                    self._store_closed_kline(kline)
             except Exception as exc:
                 self._report_error(f'Live candle update failed: {exc}')
         if self._pending_trade is not None:
             trade = self._pending_trade
             self._pending_trade = None
             try:
-                self.candles.update_live_trade(trade)
+                self._update_live_trade(trade)
             except Exception as exc:
                 self._report_error(f'Live trade update failed: {exc}')
         self._recompute_indicators(immediate=True, reason="live")
@@ -2596,6 +3350,10 @@ class ChartView(QWidget):
         cached_range = self.store.get_cached_range(self.exchange, symbol, timeframe)
         self._load_initial_data(use_cache_only=bool(cached_range))
 
+    def _set_candle_timeframe(self, timeframe: str) -> None:
+        self.candles.set_timeframe(timeframe)
+        self._tf_ms = self.candles.timeframe_ms or 60_000
+
     def _update_chart_header(self, symbol: str, timeframe: str) -> None:
         try:
             self.candles.set_header(f'{symbol} {timeframe}')
@@ -2607,6 +3365,16 @@ class ChartView(QWidget):
             return
         if self._clamp_in_progress:
             return
+        now_ms = _monotonic_ms()
+        elapsed_ms = now_ms - self._last_range_change_ms
+        if elapsed_ms < self._view_range_throttle_ms:
+            # Drags fire sigRangeChanged far faster than the screen refreshes; the
+            # trailing call picks up whatever range the view settles on.
+            if not self._view_range_trailing_timer.isActive():
+                self._view_range_trailing_timer.start(self._view_range_throttle_ms - elapsed_ms)
+            return
+        self._last_range_change_ms = now_ms
+        self._view_range_trailing_timer.stop()
         try:
             view_box = self.plot_widget.getViewBox()
             x_range, _ = view_box.viewRange()
@@ -2629,7 +3397,7 @@ class ChartView(QWidget):
                         self.visible_ts_range_changed.emit(ts_min, ts_max)
                     finally:
                         self._emitting_visible_range = False
-        tf_ms = self.candles.timeframe_ms or 60_000
+        tf_ms = self._tf_ms
         span = x_max - x_min
         span_bars = span / tf_ms if tf_ms > 0 else span
         self._last_visible_bars = int(span_bars) if span_bars is not None else 0
@@ -2689,19 +3457,17 @@ class ChartView(QWidget):
             if not self._pending_backfill_view:
                 return
             x_min, x_max = self._pending_backfill_view
-        tf_ms = self.candles.timeframe_ms or 60_000
+        tf_ms = self._tf_ms
         visible_span = max(1.0, x_max - x_min)
         edge_threshold = max(5 * tf_ms, visible_span * 0.08)
         current_min_ts, current_max_ts = self._current_loaded_range()
         if current_min_ts is None or current_max_ts is None:
             return
-        symbol = self.symbol_box.currentText() or 'BTCUSDT'
-        timeframe = self.current_timeframe
-        oldest_ts, oldest_reached = self.store.get_history_limit(self.exchange, symbol, timeframe)
+        oldest_ts, oldest_reached = self.store.get_history_limit(self.exchange, self._active_symbol, self._active_timeframe)
         now_ms = int(time.time() * 1000)
         if self._backfill_decision_worker and self._backfill_decision_worker.isRunning():
             return
-        self._backfill_decision_last_start = time.time()
+        self._backfill_decision_last_start = _monotonic_ms()
         self._backfill_decision_worker = BackfillDecisionWorker(
             x_min,
             x_max,
@@ -2718,7 +3484,7 @@ class ChartView(QWidget):
 
     def _on_backfill_decision(self, result: dict) -> None:
         if hasattr(self, "_backfill_decision_last_start"):
-            self._backfill_decision_last_ms = int((time.time() - self._backfill_decision_last_start) * 1000)
+            self._backfill_decision_last_ms = _monotonic_ms() - self._backfill_decision_last_start
             self._backfill_decision_last_ts = time.time()
             self._perf_note("backfill_decision", self._backfill_decision_last_ms)
         action = result.get("action")
@@ -2734,7 +3500,7 @@ class ChartView(QWidget):
             self._backfill_pending = False
             return
         x_min, x_max = self._pending_backfill_view
-        tf_ms = self.candles.timeframe_ms or 60_000
+        tf_ms = self._tf_ms
         visible_span = max(1.0, x_max - x_min)
         visible_bars = max(1.0, visible_span / float(tf_ms))
         window_bars = max(self._window_bars, int(visible_bars * 1.5))
@@ -2753,12 +3519,10 @@ class ChartView(QWidget):
             if desired_start >= self._window_start_ms and desired_end <= self._window_end_ms:
                 self._backfill_pending = False
                 return
-        symbol = self.symbol_box.currentText() or 'BTCUSDT'
-        timeframe = self.current_timeframe
         self._start_fetch(
             'window',
-            symbol,
-            timeframe,
+            self._active_symbol,
+            self._active_timeframe,
             0,
             window_start_ms=desired_start,
             window_end_ms=desired_end,
@@ -2766,13 +3530,8 @@ class ChartView(QWidget):
         self._backfill_pending = False
 
     def _current_loaded_range(self) -> tuple[Optional[int], Optional[int]]:
-        candles = getattr(self.candles, 'candles', [])
-        if not candles:
-            return None, None
-        try:
-            return int(candles[0][0]), int(candles[-1][0])
-        except Exception:
-            return None, None
+        # O(1): served from the chart's cached (count, first ts, last ts) key.
+        return self.candles.get_time_range()
 
     def get_visible_ts_range_snapshot(self) -> tuple[int, int]:
         try:
@@ -2781,17 +3540,17 @@ class ChartView(QWidget):
             return int(x_range[0]), int(x_range[1])
         except Exception:
             now_ms = int(time.time() * 1000)
-            tf_ms = self.candles.timeframe_ms or 60_000
+            tf_ms = self._tf_ms
             return now_ms - tf_ms * 200, now_ms
 
     def jump_to_ts(self, ts_ms: int) -> None:
         try:
-            tf_ms = self.candles.timeframe_ms or 60_000
+            tf_ms = self._tf_ms
             span = tf_ms * 400
             start = max(0, int(ts_ms - span / 2))
             end = int(ts_ms + span / 2)
             self._pending_backfill_view = (float(start), float(end))
-            self._start_fetch('window', self.symbol_box.currentText() or 'BTCUSDT', self.current_timeframe, 0, window_start_ms=start, window_end_ms=end)
+            self._start_fetch('window', self._active_symbol, self._active_timeframe, 0, window_start_ms=start, window_end_ms=end)
             view_box = self.plot_widget.getViewBox()
             view_box.setXRange(start, end, padding=0)
         except Exception:
@@ -2799,9 +3558,7 @@ class ChartView(QWidget):
 
     def _refresh_history_end_status(self) -> None:
         try:
-            symbol = self.symbol_box.currentText() or 'BTCUSDT'
-            timeframe = self.current_timeframe
-            oldest_ts, oldest_reached = self.store.get_history_limit(self.exchange, symbol, timeframe)
+            oldest_ts, oldest_reached = self.store.get_history_limit(self.exchange, self._active_symbol, self._active_timeframe)
             current_min_ts, _ = self._current_loaded_range()
             reached = bool(oldest_reached and oldest_ts is not None and current_min_ts is not None and current_min_ts <= oldest_ts)
             self.candles.set_history_end(reached)
@@ -2809,76 +3566,91 @@ class ChartView(QWidget):
             pass
 
     def clear_history_end(self) -> None:
-        symbol = self.symbol_box.currentText() or 'BTCUSDT'
-        timeframe = self.current_timeframe
+        symbol = self._active_symbol
+        timeframe = self._active_timeframe
         try:
             self.store.clear_history_limit(self.exchange, symbol, timeframe)
         except Exception as exc:
             self._report_error(f'History limit reset failed: {exc}')
             return
+        # The stored limit is gone, so the next probe for this pair must not be skipped as fresh.
+        self._history_probe_cache.pop((symbol, timeframe), None)
         try:
             self.candles.set_history_end(False)
         except Exception:
             pass
         self._emit_debug_state()
 
+    def _start_cache_state_probe(self, key: tuple, symbol: str, timeframe: str) -> None:
+        worker = CacheStateWorker(self.store, self.exchange, symbol, timeframe, key)
+        worker.result.connect(self._on_cache_state_result)
+        worker.finished.connect(self._on_cache_state_finished)
+        self._cache_state_worker = worker
+        worker.start()
+
+    def _on_cache_state_result(self, key: tuple, state: tuple) -> None:
+        self._debug_store_key = key
+        self._debug_store_state = state
+
+    def _on_cache_state_finished(self) -> None:
+        if self.sender() is self._cache_state_worker:
+            self._cache_state_worker = None
+
     def _perf_note(self, key: str, ms: int) -> None:
-        try:
-            now = time.time()
-            buf = self._perf_samples.setdefault(key, [])
-            buf.append((now, int(ms)))
-            cutoff = now - float(self._perf_window_s)
-            while buf and buf[0][0] < cutoff:
-                buf.pop(0)
-        except Exception:
-            pass
+        now = time.monotonic()
+        ring = self._perf_samples.get(key)
+        if ring is None:
+            ring = PerfRing(self._perf_max_samples)
+            self._perf_samples[key] = ring
+        ring.push(now, int(ms))
+        ring.prune(now - self._perf_window_s)
+
+    def _perf_summaries(self, keys: Tuple[str, ...]) -> List[tuple[float, int, int]]:
+        # One clock read and window cutoff shared by every key.
+        cutoff = time.monotonic() - self._perf_window_s
+        summaries = []
+        for key in keys:
+            ring = self._perf_samples.get(key)
+            if ring is None:
+                summaries.append((0.0, 0, 0))
+                continue
+            ring.prune(cutoff)
+            summaries.append(ring.summary())
+        return summaries
 
-    def _perf_summary(self, key: str) -> tuple[float, int, int]:
-        buf = self._perf_samples.get(key) or []
-        if not buf:
-            return 0.0, 0, 0
-        vals = [v for _, v in buf]
-        try:
-            avg = float(sum(vals)) / float(len(vals)) if vals else 0.0
-        except Exception:
-            avg = 0.0
-        try:
-            mx = int(max(vals)) if vals else 0
-        except Exception:
-            mx = 0
-        return avg, mx, int(len(vals))
+    def set_debug_state_enabled(self, enabled: bool) -> None:
+        enabled = bool(enabled)
+        if enabled == self._debug_state_enabled:
+            return
+        self._debug_state_enabled = enabled
+        if enabled:
+            # Refresh right away instead of waiting for the next chart event.
+            self._debug_last_update = 0.0
+            self._emit_debug_state()
 
     def _emit_debug_state(self) -> None:
         if self.debug_sink is None:
             return
         now = time.time()
-        if now - self._debug_last_update < 0.5:
+        if now - self._debug_last_update < self._debug_min_interval_s:
             return
         self._debug_last_update = now
 
-        symbol = self.symbol_box.currentText() or 'BTCUSDT'
-        timeframe = self.current_timeframe
-        bars_loaded = len(getattr(self.candles, 'candles', []))
-        tf_ms = self.candles.timeframe_ms or 60_000
-        cache_range = self.store.get_cached_range(self.exchange, symbol, timeframe)
-        oldest_ts, oldest_reached = self.store.get_history_limit(self.exchange, symbol, timeframe)
-
-        view_range = None
-        visible_bars = None
+        tf_ms = self._tf_ms
+        # The view range as whole milliseconds, converted once and shared by every consumer below.
+        ts_min: Optional[int] = None
+        ts_max: Optional[int] = None
         try:
             view_box = self.plot_widget.getViewBox()
             x_range, _ = view_box.viewRange()
-            view_range = x_range
-            span = x_range[1] - x_range[0]
-            visible_bars = span / tf_ms if tf_ms > 0 else None
+            ts_min = int(x_range[0])
+            ts_max = int(x_range[1])
         except Exception:
             pass
 
         # Keep strategy UI widgets in sync (resolved range + report x-range) without adding more timers/signals.
-        if view_range is not None:
+        if ts_min is not None:
             try:
-                ts_min = int(view_range[0])
-                ts_max = int(view_range[1])
                 if self.strategy_panel is not None:
                     self.strategy_panel.set_resolved_visible_range(ts_min, ts_max)
                 if self.strategy_report is not None:
@@ -2886,13 +3658,26 @@ class ChartView(QWidget):
             except Exception:
                 pass
 
+        # The metrics below cost store queries plus formatting; skip them while nobody is looking.
+        if not self._debug_state_enabled:
+            return
+
+        started = time.perf_counter()
+        symbol = self._active_symbol
+        timeframe = self._active_timeframe
+        bars_loaded = len(self.candles.candles)
+        # Only re-query SQLite when the symbol/timeframe changed or the store has been written since,
+        # and do it on a worker so the UI thread never waits on the database for diagnostics.
+        store_key = (symbol, timeframe, self.store.ohlcv_version)
+        if store_key != self._debug_store_key and self._cache_state_worker is None:
+            self._start_cache_state_probe(store_key, symbol, timeframe)
+        if self._debug_store_key is not None and self._debug_store_key[:2] == (symbol, timeframe):
+            cache_range, oldest_ts, oldest_reached = self._debug_store_state
+        else:
+            cache_range, oldest_ts, oldest_reached = None, None, False
+
         def fmt_ts(ts: Optional[int]) -> str:
-            if ts is None:
-                return 'n/a'
-            try:
-                return datetime.fromtimestamp(ts / 1000.0).strftime('%Y-%m-%d %H:%M:%S')
-            except Exception:
-                return str(ts)
+            return 'n/a' if ts is None else _fmt_ts_ms(int(ts))
 
         lines = [
             f'Symbol: {symbol}',
@@ -2903,10 +3688,10 @@ class ChartView(QWidget):
         lines.append(f'Render FPS: {fps:.1f}')
         if last_render_ms:
             lines.append(f'Last render: {fmt_ts(last_render_ms)}')
-        if view_range:
-            lines.append(f'View range: {int(view_range[0])} .. {int(view_range[1])}')
-        if visible_bars is not None:
-            lines.append(f'Visible bars: {visible_bars:.0f}')
+        if ts_min is not None:
+            lines.append(f'View range: {ts_min} .. {ts_max}')
+            if tf_ms > 0:
+                lines.append(f'Visible bars: {(ts_max - ts_min) // tf_ms}')
         if cache_range:
             lines.append(f'Cache range: {fmt_ts(cache_range[0])} .. {fmt_ts(cache_range[1])}')
         else:
@@ -2925,10 +3710,12 @@ class ChartView(QWidget):
             self._volume_prep_last_seen_ts = vol_update_ts
             self._perf_note("volume_prep", int(vol_ms))
 
-        ind_avg, ind_max, ind_n = self._perf_summary("indicator_compute")
-        norm_avg, norm_max, norm_n = self._perf_summary("candle_normalize")
-        back_avg, back_max, back_n = self._perf_summary("backfill_decision")
-        vol_avg, vol_max, vol_n = self._perf_summary("volume_prep")
+        (
+            (ind_avg, ind_max, ind_n),
+            (norm_avg, norm_max, norm_n),
+            (back_avg, back_max, back_n),
+            (vol_avg, vol_max, vol_n),
+        ) = self._perf_summaries(("indicator_compute", "candle_normalize", "backfill_decision", "volume_prep"))
         lines.append(
             "Perf budget (5s avg/max, n): "
             f"ind={ind_avg:.0f}/{ind_max} ({ind_n}) | "
@@ -2937,18 +3724,10 @@ class ChartView(QWidget):
             f"vol={vol_avg:.0f}/{vol_max} ({vol_n})"
         )
 
-        try:
-            total_instances = len(self._indicator_instances)
-            active_instances = sum(1 for inst in self._indicator_instances if inst.get("visible", True) is not False)
-        except Exception:
-            total_instances = 0
-            active_instances = 0
-        try:
-            per_pane = {pane_id: len(getattr(r, "_items", {}) or {}) for pane_id, r in self._indicator_renderers.items()}
-            total_items = sum(per_pane.values())
-        except Exception:
-            per_pane = {}
-            total_items = 0
+        total_instances = len(self._indicator_instances)
+        active_instances = self._indicator_visible_count
+        per_pane = {pane_id: r.item_count for pane_id, r in self._indicator_renderers.items()}
+        total_items = sum(per_pane.values())
         try:
             candle_body_chunks, candle_line_chunks, candle_chunk_size = self.candles.get_candle_chunk_stats()
             vol_chunks, vol_chunk_size = self.candles.get_volume_chunk_stats()
@@ -2963,12 +3742,14 @@ class ChartView(QWidget):
             f"Chunks: candles body={candle_body_chunks} line={candle_line_chunks} (size {candle_chunk_size}) | "
             f"volume={vol_chunks} (size {vol_chunk_size})"
         )
-        lines.append(f'Worker running: {bool(self._worker and self._worker.isRunning())}')
+        lines.append(f'Worker running: {self._fetch_running}')
         lines.append(f'Window pending: {self._backfill_pending}')
-        lines.append(f'Live kline: {bool(self._kline_worker and self._kline_worker.isRunning())}')
-        lines.append(f'Live trades: {bool(self._trade_worker and self._trade_worker.isRunning())}')
+        lines.append(f'Live kline: {self._kline_running}')
+        lines.append(f'Live trades: {self._trade_running}')
 
         try:
-            self.debug_sink.set_metrics(lines)
+            self.debug_sink.set_metrics_text('\n'.join(lines))
         except Exception:
             pass
+        # Back off on machines where a refresh is slow, so the panel never takes more than ~25% of the UI thread.
+        self._debug_min_interval_s = max(0.5, (time.perf_counter() - started) * 4.0)
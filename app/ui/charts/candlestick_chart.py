@@ -410,7 +410,6 @@ class CandlestickChart:
         self._countdown_timer = QTimer()
         self._countdown_timer.setInterval(1000)
         self._countdown_timer.timeout.connect(self._refresh_countdown)
-        self._last_trade_update_ms: int = 0
         self._live_price: Optional[float] = None
         self._live_open: Optional[float] = None
         self._last_live_snapshot: Optional[Tuple[int, float, float, float, float, float]] = None
@@ -429,6 +428,11 @@ class CandlestickChart:
         self.empty_label: Optional[pg.QtWidgets.QGraphicsTextItem] = None
         self.history_end_reached = False
         self._ts_cache: List[float] = []
+        # Columnar float64 mirror of self.candles (time, open, high, low, close, volume rows)
+        # with spare capacity so live appends don't copy.
+        self._ohlcv_buf = np.empty((6, 0), dtype=np.float64)
+        self._ohlcv_len = 0
+        self._bars_key: Optional[Tuple[int, float, float]] = None
         self.strategy_overlay: Optional[StrategyOverlayRenderer] = None
         self._candle_width_ms = 60_000 * 0.8
         self._render_count = 0
@@ -965,7 +969,13 @@ class CandlestickChart:
         if self.empty_label is not None:
             self.empty_label.hide()
 
-    def set_historical_data(self, data: List[Iterable[float]], auto_range: bool = True, normalized: bool = False) -> None:
+    def set_historical_data(
+        self,
+        data: List[Iterable[float]],
+        auto_range: bool = True,
+        normalized: bool = False,
+        ohlcv: Optional[np.ndarray] = None,
+    ) -> None:
         normalized_data = []
         if normalized:
             normalized_data = data
@@ -987,6 +997,7 @@ class CandlestickChart:
         if not normalized_data:
             self.candles = []
             self._ts_cache = []
+            self._reset_ohlcv_array()
             self.item.set_data([])
             self._update_volume_histogram([])
             if self.strategy_overlay is not None:
@@ -997,7 +1008,11 @@ class CandlestickChart:
             self._show_empty_state()
             return
         self.candles = normalized_data
-        self._ts_cache = [float(c[0]) for c in self.candles]
+        self._reset_ohlcv_array(ohlcv)
+        if self._ohlcv_len == len(self.candles):
+            self._ts_cache = self._ohlcv_buf[0, :self._ohlcv_len].tolist()
+        else:
+            self._ts_cache = [float(c[0]) for c in self.candles]
         if self.strategy_overlay is not None:
             try:
                 self.strategy_overlay.set_ts_cache(self._ts_cache)
@@ -1038,7 +1053,64 @@ class CandlestickChart:
         except Exception:
             pass
 
+    def _reset_ohlcv_array(self, ohlcv: Optional[np.ndarray] = None) -> None:
+        self._ohlcv_len = 0
+        self._bars_key = None
+        if not self.candles:
+            self._ohlcv_buf = np.empty((6, 0), dtype=np.float64)
+            return
+        if ohlcv is not None and ohlcv.shape == (6, len(self.candles)):
+            # Caller already has the columns (e.g. a merge of cached segments); skip the row conversion.
+            self._ohlcv_buf = np.ascontiguousarray(ohlcv, dtype=np.float64)
+            self._ohlcv_len = ohlcv.shape[1]
+            self._update_bars_key()
+            return
+        try:
+            rows = np.asarray(self.candles, dtype=np.float64)
+        except (ValueError, TypeError):
+            # Ragged rows; callers see a size mismatch and fall back to the list.
+            self._ohlcv_buf = np.empty((6, 0), dtype=np.float64)
+            return
+        if rows.ndim != 2 or rows.shape[1] < 6:
+            self._ohlcv_buf = np.empty((6, 0), dtype=np.float64)
+            return
+        self._ohlcv_buf = np.ascontiguousarray(rows[:, :6].T)
+        self._ohlcv_len = rows.shape[0]
+        self._update_bars_key()
+
+    def _set_ohlcv_row(self, idx: int, row: List[float]) -> None:
+        if idx == self._ohlcv_len:
+            if idx >= self._ohlcv_buf.shape[1]:
+                capacity = max(64, self._ohlcv_buf.shape[1] + self._ohlcv_buf.shape[1] // 2)
+                grown = np.empty((6, capacity), dtype=np.float64)
+                grown[:, :self._ohlcv_len] = self._ohlcv_buf[:, :self._ohlcv_len]
+                self._ohlcv_buf = grown
+            self._ohlcv_len += 1
+        elif idx != self._ohlcv_len - 1:
+            # Out of sync with self.candles; the size mismatch makes callers use the list.
+            return
+        self._ohlcv_buf[:, idx] = row[:6]
+        self._update_bars_key()
+
+    def _update_bars_key(self) -> None:
+        n = self._ohlcv_len
+        self._bars_key = (n, float(self._ohlcv_buf[0, 0]), float(self._ohlcv_buf[0, n - 1])) if n else None
+
+    def get_ohlcv_array(self) -> np.ndarray:
+        # (6, n) view; rows are time, open, high, low, close, volume.
+        return self._ohlcv_buf[:, :self._ohlcv_len]
+
+    def get_bars_key(self) -> Optional[Tuple[int, float, float]]:
+        # (count, first ts, last ts) of the OHLCV buffer, kept current on every write.
+        return self._bars_key
+
+    def get_ts_array(self) -> np.ndarray:
+        return self._ohlcv_buf[0, :self._ohlcv_len]
+
     def get_time_range(self) -> Tuple[Optional[int], Optional[int]]:
+        key = self._bars_key
+        if key is not None and key[0] == len(self.candles):
+            return int(key[1]), int(key[2])
         if not self._ts_cache:
             return None, None
         try:
@@ -1089,15 +1161,19 @@ class CandlestickChart:
 
         if not self.candles:
             self.candles = [[ts_ms, o, h, l, c, v]]
+            self._ts_cache = [float(ts_ms)]
+            self._reset_ohlcv_array()
         else:
             last_ts = int(self.candles[-1][0])
             if ts_ms == last_ts:
                 self.candles[-1] = [ts_ms, o, h, l, c, v]
+                self._set_ohlcv_row(len(self.candles) - 1, self.candles[-1])
             elif ts_ms > last_ts:
                 self.candles.append([ts_ms, o, h, l, c, v])
+                self._ts_cache.append(float(ts_ms))
+                self._set_ohlcv_row(len(self.candles) - 1, self.candles[-1])
             else:
                 return
-        self._ts_cache = [float(c[0]) for c in self.candles]
 
         self.last_kline_ts_ms = ts_ms
         self.last_close_ms = int(kline.get('close_ms', 0)) or None
@@ -1135,16 +1211,15 @@ class CandlestickChart:
         if ts_ms < last_ts or ts_ms >= last_ts + self.timeframe_ms:
             return
 
-        now_ms = int(datetime.now().timestamp() * 1000)
-        if now_ms - self._last_trade_update_ms < 100:
-            return
-        self._last_trade_update_ms = now_ms
-
+        # Every drained batch is merged so volume and wick extremes are kept; repaint rate is
+        # bounded by the drain interval and the single-shot live redraw timer.
         o, h, l, _, v = float(last[1]), float(last[2]), float(last[3]), float(last[4]), float(last[5])
-        h = max(h, price)
-        l = min(l, price)
+        # Batched trades carry the extremes seen inside the batch; single trades fall back to the price.
+        h = max(h, float(trade.get('high', price)))
+        l = min(l, float(trade.get('low', price)))
         v = v + max(0.0, qty)
         self.candles[-1] = [last_ts, o, h, l, price, v]
+        self._set_ohlcv_row(len(self.candles) - 1, self.candles[-1])
 
         self._queue_live_redraw()
 
@@ -9,7 +9,15 @@ class DebugDock(QDockWidget):
         self.text = QTextEdit()
         self.text.setReadOnly(True)
         self.text.setPlaceholderText('Debug metrics will appear here.')
+        self._metrics_text = ''
         self.setWidget(self.text)
 
     def set_metrics(self, lines: list[str]) -> None:
-        self.text.setPlainText('\n'.join(lines))
+        self.set_metrics_text('\n'.join(lines))
+
+    def set_metrics_text(self, text: str) -> None:
+        # setPlainText rebuilds the whole document and resets the scroll position; skip it when nothing moved.
+        if text == self._metrics_text:
+            return
+        self._metrics_text = text
+        self.text.setPlainText(text)
@@ -102,9 +102,7 @@ class IndicatorPanel(QDockWidget):
         self._pane_ids = pane_ids
         self.active_list.clear()
         for info in instances:
-            name = info.get("name", info.get("indicator_id", "indicator"))
-            pane_label = info.get("pane_id", "price")
-            item = QListWidgetItem(f"{name} ({pane_label})")
+            item = QListWidgetItem(self._instance_label(info))
             item.setData(Qt.ItemDataRole.UserRole, info["instance_id"])
             self.active_list.addItem(item)
         self._refresh_pane_combo()
@@ -116,6 +114,34 @@ class IndicatorPanel(QDockWidget):
         else:
             self._clear_selection()
 
+    def update_instance(self, instance: dict) -> None:
+        # In-place edit of a listed instance; the list and pane set are unchanged, so no rebuild.
+        instance_id = instance["instance_id"]
+        previous = self._instances.get(instance_id)
+        if previous is None:
+            return
+        self._instances[instance_id] = instance
+        for idx in range(self.active_list.count()):
+            item = self.active_list.item(idx)
+            if item.data(Qt.ItemDataRole.UserRole) == instance_id:
+                item.setText(self._instance_label(instance))
+                break
+        if instance_id != self._active_instance_id:
+            return
+        self.visibility_button.setText("Hide" if bool(instance.get("visible", True)) else "Show")
+        idx = self.pane_combo.findText(instance.get("pane_id", "price"))
+        if idx >= 0:
+            self.pane_combo.blockSignals(True)
+            self.pane_combo.setCurrentIndex(idx)
+            self.pane_combo.blockSignals(False)
+        if previous.get("params") != instance.get("params") or previous.get("schema") is not instance.get("schema"):
+            self._render_params(instance)
+
+    def _instance_label(self, instance: dict) -> str:
+        name = instance.get("name", instance.get("indicator_id", "indicator"))
+        pane_label = instance.get("pane_id", "price")
+        return f"{name} ({pane_label})"
+
     def _refresh_pane_combo(self) -> None:
         self.pane_combo.blockSignals(True)
         self.pane_combo.clear()
@@ -259,6 +285,10 @@ class IndicatorPanel(QDockWidget):
                 params[key] = widget.isChecked()
             elif isinstance(widget, QComboBox):
                 params[key] = widget.currentText()
+        instance = self._instances.get(self._active_instance_id)
+        if instance is not None:
+            # Keep the local copy current so a later update_instance doesn't rebuild these widgets.
+            instance["params"] = params
         self.indicator_params_changed.emit(self._active_instance_id, params)
 
     def _toggle_visibility(self) -> None:
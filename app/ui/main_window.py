@@ -128,6 +128,8 @@ class MainWindow(QMainWindow):
         self.setTabPosition(Qt.DockWidgetArea.RightDockWidgetArea, QTabWidget.TabPosition.East)
         self.indicator_panel.raise_()
         self._set_dock_icons()
+        self.chart_view.set_debug_state_enabled(self.debug_dock.isVisible())
+        self.debug_dock.visibilityChanged.connect(self.chart_view.set_debug_state_enabled)
 
         self._settings = QSettings('PySuperChart', 'PySuperChart')
         self._setup_menu()
@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Allow `import core.*` like the app does when running `python app/main.py`.
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+APP_DIR = os.path.join(REPO_ROOT, "app")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from core.data_store import DataStore
+
+
+class DataStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.NamedTemporaryFile(prefix="store_test_", suffix=".sqlite", delete=False)
+        tmp.close()
+        self.path = tmp.name
+        self.store = DataStore(self.path)
+
+    def tearDown(self) -> None:
+        for p in (self.path, self.path + "-wal", self.path + "-shm"):
+            try:
+                os.remove(p)
+            except Exception:
+                pass
+
+    def test_upsert_indicator_instances_round_trip(self):
+        self.store.upsert_indicator_instances([
+            ("b", "rsi", "pane-1", '{"length": 14}', False, 1),
+            ("a", "sma", "price", '{"length": 20}', True, 0),
+        ])
+        rows = self.store.get_indicator_instances()
+        self.assertEqual(rows, [
+            ("a", "sma", "price", '{"length": 20}', True, 0),
+            ("b", "rsi", "pane-1", '{"length": 14}', False, 1),
+        ])
+        for row in rows:
+            self.assertIs(type(row[4]), bool)
+            self.assertIs(type(row[5]), int)
+
+    def test_upsert_indicator_instances_updates_existing_rows(self):
+        self.store.upsert_indicator_instances([
+            ("a", "sma", "price", '{"length": 20}', True, 0),
+            ("b", "rsi", "pane-1", '{"length": 14}', True, 1),
+        ])
+        self.store.upsert_indicator_instances([
+            ("a", "sma", "pane-2", '{"length": 50}', False, 2),
+        ])
+        rows = self.store.get_indicator_instances()
+        self.assertEqual(rows, [
+            ("b", "rsi", "pane-1", '{"length": 14}', True, 1),
+            ("a", "sma", "pane-2", '{"length": 50}', False, 2),
+        ])
+
+    def test_upsert_indicator_instances_empty_is_noop(self):
+        self.store.upsert_indicator_instances([])
+        self.assertEqual(self.store.get_indicator_instances(), [])
+
+    def test_get_cache_state_empty(self):
+        self.assertEqual(self.store.get_cache_state("binance", "TEST", "1m"), (None, None, False))
+
+    def test_get_cache_state_populated_range(self):
+        bars = [[ts, 10.0, 11.0, 9.0, 10.5, 100.0] for ts in (180_000, 60_000, 120_000)]
+        self.store.store_bars("binance", "TEST", "1m", bars)
+        # Other symbols/timeframes must not leak into the range.
+        self.store.store_bars("binance", "TEST", "5m", [[0, 1.0, 1.0, 1.0, 1.0, 1.0]])
+        self.store.store_bars("binance", "OTHER", "1m", [[600_000, 1.0, 1.0, 1.0, 1.0, 1.0]])
+        state = self.store.get_cache_state("binance", "TEST", "1m")
+        self.assertEqual(state, ((60_000, 180_000), None, False))
+        self.assertEqual(state[0], self.store.get_cached_range("binance", "TEST", "1m"))
+
+    def test_get_cache_state_with_history_limit(self):
+        self.store.store_bars("binance", "TEST", "1m", [[60_000, 10.0, 11.0, 9.0, 10.5, 100.0]])
+        self.store.set_history_limit("binance", "TEST", "1m", 30_000, False)
+        self.assertEqual(self.store.get_cache_state("binance", "TEST", "1m"), ((60_000, 60_000), 30_000, False))
+        self.store.set_history_limit("binance", "TEST", "1m", 60_000, True)
+        state = self.store.get_cache_state("binance", "TEST", "1m")
+        self.assertEqual(state, ((60_000, 60_000), 60_000, True))
+        self.assertIs(type(state[2]), bool)
+        self.assertEqual(state[1:], self.store.get_history_limit("binance", "TEST", "1m"))
+
+    def test_get_cache_state_history_limit_without_bars(self):
+        self.store.set_history_limit("binance", "TEST", "1h", None, True)
+        self.assertEqual(self.store.get_cache_state("binance", "TEST", "1h"), (None, None, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,300 @@
+import os
+import sys
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+# Allow `import indicators.*` like the app does when running `python app/main.py`.
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+APP_DIR = os.path.join(REPO_ROOT, "app")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from indicators import helpers
+
+
+# Reference implementations: the plain NumPy helpers the loop kernels replaced.
+
+def _ref_smooth(values, alpha):
+    arr = np.asarray(values, dtype=np.float64)
+    out = np.full(arr.size, np.nan, dtype=np.float64)
+    val = np.nan
+    for i in range(arr.size):
+        v = arr[i]
+        if np.isnan(v):
+            out[i] = val
+            continue
+        val = v if np.isnan(val) else alpha * v + (1 - alpha) * val
+        out[i] = val
+    return out
+
+
+def _ref_ema(values, length):
+    if length <= 0:
+        return np.full(np.asarray(values).size, np.nan, dtype=np.float64)
+    return _ref_smooth(values, 2.0 / (length + 1.0))
+
+
+def _ref_rma(values, length):
+    if length <= 0:
+        return np.full(np.asarray(values).size, np.nan, dtype=np.float64)
+    return _ref_smooth(values, 1.0 / float(length))
+
+
+def _ref_wma(values, length):
+    arr = np.asarray(values, dtype=np.float64)
+    out = np.full(arr.size, np.nan, dtype=np.float64)
+    if length <= 0:
+        return out
+    weights = np.arange(1, length + 1, dtype=np.float64)
+    for i in range(length - 1, arr.size):
+        window = arr[i + 1 - length: i + 1]
+        if not np.any(np.isnan(window)):
+            out[i] = np.dot(window, weights) / weights.sum()
+    return out
+
+
+def _ref_stdev(values, length):
+    arr = np.asarray(values, dtype=np.float64)
+    out = np.full(arr.size, np.nan, dtype=np.float64)
+    if length <= 0:
+        return out
+    for i in range(length - 1, arr.size):
+        window = arr[i + 1 - length: i + 1]
+        if not np.any(np.isnan(window)):
+            out[i] = np.std(window)
+    return out
+
+
+def _ref_stoch(h, l, c, k_len, d_len):
+    k = np.full(c.size, np.nan, dtype=np.float64)
+    if k_len <= 0:
+        return k, k.copy()
+    for i in range(k_len - 1, c.size):
+        hh = np.nanmax(h[i + 1 - k_len: i + 1])
+        ll = np.nanmin(l[i + 1 - k_len: i + 1])
+        if hh - ll != 0:
+            k[i] = (c[i] - ll) / (hh - ll) * 100.0
+    return k, helpers.sma(k, d_len)
+
+
+def _ref_atr(h, l, c, length):
+    tr = np.full(c.size, np.nan, dtype=np.float64)
+    if c.size == 0:
+        return tr
+    tr[0] = h[0] - l[0]
+    for i in range(1, c.size):
+        tr[i] = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+    return _ref_rma(tr, length)
+
+
+def _ref_dmi(h, l, c, length):
+    plus_dm = np.zeros(c.size, dtype=np.float64)
+    minus_dm = np.zeros(c.size, dtype=np.float64)
+    for i in range(1, c.size):
+        up = h[i] - h[i - 1]
+        down = l[i - 1] - l[i]
+        plus_dm[i] = up if up > down and up > 0 else 0.0
+        minus_dm[i] = down if down > up and down > 0 else 0.0
+    atr_vals = _ref_rma(_ref_atr(h, l, c, 1), length)
+    return 100 * _ref_rma(plus_dm, length) / atr_vals, 100 * _ref_rma(minus_dm, length) / atr_vals
+
+
+def _ref_supertrend(h, l, c, length, mult):
+    out = np.full(c.size, np.nan, dtype=np.float64)
+    atr_vals = _ref_atr(h, l, c, length)
+    hl2 = (h + l) / 2.0
+    upper = hl2 + mult * atr_vals
+    lower = hl2 - mult * atr_vals
+    direction = 1
+    for i in range(c.size):
+        if np.isnan(atr_vals[i]):
+            continue
+        if i == 0:
+            out[i] = upper[i]
+            continue
+        if c[i] > upper[i - 1]:
+            direction = 1
+        elif c[i] < lower[i - 1]:
+            direction = -1
+        prev = out[i - 1]
+        if direction > 0:
+            out[i] = max(lower[i], prev if not np.isnan(prev) else lower[i])
+        else:
+            out[i] = min(upper[i], prev if not np.isnan(prev) else upper[i])
+    return out
+
+
+def _ref_psar(h, l, accel, max_accel):
+    out = np.full(h.size, np.nan, dtype=np.float64)
+    if h.size == 0:
+        return out
+    uptrend = True
+    ep = h[0]
+    sar = l[0]
+    af = accel
+    out[0] = sar
+    for i in range(1, h.size):
+        sar = sar + af * (ep - sar)
+        if uptrend:
+            sar = min(sar, l[i - 1], l[i])
+            if h[i] > ep:
+                ep = h[i]
+                af = min(af + accel, max_accel)
+            if l[i] < sar:
+                uptrend, sar, ep, af = False, ep, l[i], accel
+        else:
+            sar = max(sar, h[i - 1], h[i])
+            if l[i] < ep:
+                ep = l[i]
+                af = min(af + accel, max_accel)
+            if h[i] > sar:
+                uptrend, sar, ep, af = True, ep, h[i], accel
+        out[i] = sar
+    return out
+
+
+def _ref_extreme(values, length, want_max):
+    arr = np.asarray(values, dtype=np.float64)
+    out = np.full(arr.size, np.nan, dtype=np.float64)
+    if length <= 0:
+        return out
+    reduce = np.nanmax if want_max else np.nanmin
+    for i in range(length - 1, arr.size):
+        out[i] = reduce(arr[i + 1 - length: i + 1])
+    return out
+
+
+def _ref_vwma(values, length, volume):
+    arr = np.asarray(values, dtype=np.float64)
+    vol = np.asarray(volume, dtype=np.float64)
+    out = np.full(arr.size, np.nan, dtype=np.float64)
+    if length <= 0 or arr.size == 0:
+        return out
+    for i in range(length - 1, arr.size):
+        p = arr[i + 1 - length: i + 1]
+        v = vol[i + 1 - length: i + 1]
+        if np.any(np.isnan(p)) or np.any(np.isnan(v)):
+            continue
+        denom = np.sum(v)
+        if denom != 0:
+            out[i] = np.sum(p * v) / denom
+    return out
+
+
+def _ref_cci(h, l, c, length):
+    tp = (h + l + c) / 3.0
+    ma = helpers.sma(tp, length)
+    out = np.full(tp.size, np.nan, dtype=np.float64)
+    if length <= 0:
+        return out
+    for i in range(length - 1, tp.size):
+        window = tp[i + 1 - length: i + 1]
+        if np.any(np.isnan(window)) or np.isnan(ma[i]):
+            continue
+        dev = np.mean(np.abs(window - ma[i]))
+        if dev != 0:
+            out[i] = (tp[i] - ma[i]) / (0.015 * dev)
+    return out
+
+
+def _series(seed, n=400):
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(size=n))
+    high = close + rng.random(n)
+    low = close - rng.random(n)
+    gappy = close.copy()
+    gappy[:7] = np.nan
+    gappy[rng.choice(np.arange(10, n), size=12, replace=False)] = np.nan
+    gappy_high = high.copy()
+    gappy_high[rng.choice(np.arange(1, n), size=6, replace=False)] = np.nan
+    return high, low, close, gappy, gappy_high
+
+
+def _pure_python_kernels():
+    # Swap each jitted kernel for its Python source so the fallback path is checked too.
+    patches = []
+    for name in dir(helpers):
+        fn = getattr(helpers, name)
+        if name.startswith("_") and name.endswith("_loop") and hasattr(fn, "py_func"):
+            patches.append(mock.patch.object(helpers, name, fn.py_func))
+    return patches
+
+
+class IndicatorHelperKernelTests(unittest.TestCase):
+    def _cases(self, seed):
+        h, l, c, gappy, gappy_high = _series(seed)
+        return [
+            ("ema", helpers.ema(gappy, 14), _ref_ema(gappy, 14)),
+            ("rma", helpers.rma(gappy, 14), _ref_rma(gappy, 14)),
+            ("wma", helpers.wma(gappy, 10), _ref_wma(gappy, 10)),
+            ("stdev", helpers.stdev(gappy, 20), _ref_stdev(gappy, 20)),
+            ("stoch", helpers.stoch(h, l, gappy, 14, 3), _ref_stoch(h, l, gappy, 14, 3)),
+            ("atr", helpers.atr(h, l, c, 14), _ref_atr(h, l, c, 14)),
+            ("atr_gappy", helpers.atr(h, l, gappy, 14), _ref_atr(h, l, gappy, 14)),
+            ("dmi", helpers.dmi(h, l, c, 14), _ref_dmi(h, l, c, 14)),
+            ("supertrend", helpers.supertrend(h, l, c, 10, 3.0), _ref_supertrend(h, l, c, 10, 3.0)),
+            ("atr_gappy_high", helpers.atr(gappy_high, l, c, 14), _ref_atr(gappy_high, l, c, 14)),
+            ("psar", helpers.psar(h, l, 0.02, 0.2), _ref_psar(h, l, 0.02, 0.2)),
+            ("psar_gappy_high", helpers.psar(gappy_high, l, 0.02, 0.2), _ref_psar(gappy_high, l, 0.02, 0.2)),
+            ("highest", helpers.highest(gappy, 20), _ref_extreme(gappy, 20, True)),
+            ("lowest", helpers.lowest(gappy, 20), _ref_extreme(gappy, 20, False)),
+            ("vwma", helpers.vwma(c, 20, h), _ref_vwma(c, 20, h)),
+            ("vwma_gappy", helpers.vwma(gappy, 20, h), _ref_vwma(gappy, 20, h)),
+            ("vwma_gappy_volume", helpers.vwma(c, 20, gappy_high), _ref_vwma(c, 20, gappy_high)),
+            ("vwma_zero_volume", helpers.vwma(c, 5, np.zeros(c.size)), _ref_vwma(c, 5, np.zeros(c.size))),
+            ("cci", helpers.cci(h, l, c, 20), _ref_cci(h, l, c, 20)),
+            ("cci_gappy", helpers.cci(h, l, gappy, 20), _ref_cci(h, l, gappy, 20)),
+            ("cci_len0", helpers.cci(h, l, c, 0), _ref_cci(h, l, c, 0)),
+            ("ema_len0", helpers.ema(c, 0), _ref_ema(c, 0)),
+            ("wma_len_gt_n", helpers.wma(c[:5], 10), _ref_wma(c[:5], 10)),
+            ("psar_empty", helpers.psar([], [], 0.02, 0.2), _ref_psar(np.array([]), np.array([]), 0.02, 0.2)),
+        ]
+
+    def _assert_cases_match(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for seed in (1, 2, 3):
+                for name, got, want in self._cases(seed):
+                    with self.subTest(helper=name, seed=seed):
+                        got_parts = got if isinstance(got, tuple) else (got,)
+                        want_parts = want if isinstance(want, tuple) else (want,)
+                        self.assertEqual(len(got_parts), len(want_parts))
+                        for g, w in zip(got_parts, want_parts):
+                            np.testing.assert_allclose(g, w, rtol=1e-12, atol=1e-9, equal_nan=True)
+
+    def test_vwma_rejects_short_volume(self):
+        h, _, c, _, _ = _series(4)
+        for volume in (h[:-10], h[:-1]):
+            with self.subTest(volume_len=volume.size):
+                # The NumPy reference fails to broadcast the short windows; the kernel must not read past the end.
+                with self.assertRaises(ValueError):
+                    _ref_vwma(c, 20, volume)
+                with self.assertRaises(ValueError):
+                    helpers.vwma(c, 20, volume)
+
+    def test_vwma_accepts_longer_volume(self):
+        h, _, c, _, _ = _series(4)
+        longer = np.concatenate([h, h[:5]])
+        np.testing.assert_allclose(
+            helpers.vwma(c, 20, longer), _ref_vwma(c, 20, longer), rtol=1e-12, atol=1e-9, equal_nan=True
+        )
+
+    def test_helpers_match_reference(self):
+        self._assert_cases_match()
+
+    def test_helpers_match_reference_without_numba(self):
+        patches = _pure_python_kernels()
+        for p in patches:
+            p.start()
+        try:
+            self._assert_cases_match()
+        finally:
+            for p in patches:
+                p.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
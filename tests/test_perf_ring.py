@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+
+# Allow `import ui.*` like the app does when running `python app/main.py`.
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+APP_DIR = os.path.join(REPO_ROOT, "app")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from ui.chart_view import PerfRing
+
+
+class PerfRingTests(unittest.TestCase):
+    def _push_all(self, ring: PerfRing, values, start_ts: float = 0.0) -> None:
+        for i, ms in enumerate(values):
+            ring.push(start_ts + i, ms)
+
+    def test_empty_ring(self):
+        self.assertEqual(PerfRing(4).summary(), (0.0, 0, 0))
+
+    def test_partly_filled_mean_and_count(self):
+        ring = PerfRing(8)
+        self._push_all(ring, [3, 9, 6])
+        mean, peak, count = ring.summary()
+        self.assertEqual(count, 3)
+        self.assertAlmostEqual(mean, 6.0)
+        self.assertEqual(peak, 9)
+
+    def test_fill_to_capacity(self):
+        ring = PerfRing(4)
+        self._push_all(ring, [1, 2, 3, 4])
+        self.assertEqual(ring.summary(), (2.5, 4, 4))
+
+    def test_wraparound_keeps_last_capacity_samples(self):
+        ring = PerfRing(4)
+        values = [5, 1, 7, 2, 8, 3, 4]
+        self._push_all(ring, values)
+        mean, peak, count = ring.summary()
+        kept = values[-4:]
+        self.assertEqual(count, 4)
+        self.assertAlmostEqual(mean, sum(kept) / 4.0)
+        self.assertEqual(peak, max(kept))
+        self.assertEqual(ring.total, sum(kept))
+
+    def test_peak_rebuilt_after_max_is_evicted(self):
+        ring = PerfRing(3)
+        self._push_all(ring, [50, 4, 6])
+        self.assertEqual(ring.summary()[1], 50)
+        ring.push(3.0, 5)  # evicts the 50
+        mean, peak, count = ring.summary()
+        self.assertEqual((peak, count), (6, 3))
+        self.assertAlmostEqual(mean, 5.0)
+        ring.push(4.0, 2)  # evicts the 4; 6 is still the max
+        self.assertEqual(ring.summary()[1], 6)
+        ring.push(5.0, 1)  # evicts the 6
+        self.assertEqual(ring.summary(), (8 / 3.0, 5, 3))
+
+    def test_prune_drops_expired_samples_and_evicted_peak(self):
+        ring = PerfRing(8)
+        self._push_all(ring, [10, 20, 3, 4], start_ts=100.0)
+        ring.prune(102.0)  # drops ts 100 and 101, including the 20 peak
+        mean, peak, count = ring.summary()
+        self.assertEqual((peak, count), (4, 2))
+        self.assertAlmostEqual(mean, 3.5)
+        ring.prune(1000.0)
+        self.assertEqual(ring.summary(), (0.0, 0, 0))
+        ring.push(1001.0, 7)
+        self.assertEqual(ring.summary(), (7.0, 7, 1))
+
+    def test_long_run_matches_brute_force(self):
+        ring = PerfRing(16)
+        values = [(i * 37) % 101 for i in range(500)]
+        for i, ms in enumerate(values):
+            ring.push(float(i), ms)
+            kept = values[max(0, i - 15): i + 1]
+            mean, peak, count = ring.summary()
+            self.assertEqual(count, len(kept))
+            self.assertEqual(peak, max(kept))
+            self.assertAlmostEqual(mean, sum(kept) / len(kept))
+
+
+if __name__ == "__main__":
+    unittest.main()